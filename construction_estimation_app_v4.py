@@ -7,32 +7,108 @@ Enhanced with 'none' options, manual input for 'other', and dynamic task input b
 import gradio as gr
 import sys
 import os
+import logging
+import re
 import yaml
+from collections import defaultdict
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 import json
 
 # Add src to Python path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
+from src.core.config import config
 from src.services.project_service import get_project_service
 from src.models.database import get_db_manager
 
+logger = logging.getLogger(__name__)
+
+# First number in a measurement string such as "123.5 ft³" or "1,024 sq ft"
+_MEASUREMENT_NUMBER_RE = re.compile(r'\d+(?:,\d{3})*(?:\.\d+)?')
+
+
+@dataclass
+class DemodScope:
+    """Already demolished areas of a room; SF/LF amounts only apply to 'partial' status"""
+    floor: str = 'n/a'
+    floor_sf: str = ''
+    walls: str = 'n/a'
+    walls_sf: str = ''
+    ceiling: str = 'n/a'
+    ceiling_sf: str = ''
+    wall_insulation: str = 'n/a'
+    wall_insulation_sf: str = ''
+    ceiling_insulation: str = 'n/a'
+    ceiling_insulation_sf: str = ''
+    baseboard: str = 'n/a'
+    baseboard_lf: str = ''
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary, clearing amounts for items that are not partial"""
+        data = self.__dict__.copy()
+        for name in data:
+            if name.endswith(('_sf', '_lf')) and data[name.rsplit('_', 1)[0]] != 'partial':
+                data[name] = ''
+        return data
+
+
+@dataclass
+class RemovalScope:
+    """Areas of a room still to be demolished"""
+    floor: str = 'n/a'
+    walls: str = 'n/a'
+    ceiling: str = 'n/a'
+    wall_insulation: str = 'n/a'
+    ceiling_insulation: str = 'n/a'
+    baseboard: str = 'n/a'
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary"""
+        return self.__dict__.copy()
+
+
+# Field order of the scope groups, matching the order of their components in the save inputs
+DEMOD_SCOPE_FIELDS = tuple(f.name for f in fields(DemodScope))
+REMOVAL_SCOPE_FIELDS = tuple(f.name for f in fields(RemovalScope))
+
 
 class ConstructionEstimationAppV4:
     """Enhanced construction estimation app with improved input handling"""
     
+    # Maximum number of rooms returned by a search box query
+    ROOM_SEARCH_LIMIT = 50
+    
+    # Maximum number of rooms shipped when a room dropdown is (re)populated without a query;
+    # larger projects are reached through the search boxes
+    ROOM_CHOICE_LIMIT = 200
+    
     def __init__(self):
         """Initialize the application"""
         self.project_service = get_project_service()
         self.current_project_id = None
         self.current_room_id = None
         
+        # Formatted active room choices keyed by (project_id, rooms cache version)
+        self._room_choices_cache: Dict[Tuple[int, int], Tuple[List[str], List[str]]] = {}
+        self._rooms_cache_version = 0
+        
+        # Built once by create_interface and reused on later calls
+        self._interface = None
+        self._save_scope_inputs = ()
+        
+        # Formatted project list, loaded once and rebuilt only after projects or rooms change
+        self._project_list_cache: Optional[List[List]] = None
+        
         # Initialize database
         self.db_manager = get_db_manager()
         print("Database initialized successfully")
         
+        # Warm the project list so new sessions render the dropdown without a query
+        self.get_project_list_formatted()
+        
         # Define choice lists with 'none' and 'other' options
         self.finish_choices = {
             'flooring': ["none", "hardwood", "laminate", "carpet", "tile", "vinyl", "other"],
@@ -45,7 +121,10 @@ class ConstructionEstimationAppV4:
         }
     
     def get_project_list_formatted(self) -> List[List]:
-        """Get formatted project list for dropdown"""
+        """Get formatted project list for dropdown (cached until projects or rooms change)"""
+        if self._project_list_cache is not None:
+            return self._project_list_cache
+        
         try:
             projects = self.project_service.get_all_projects()
             if not projects:
@@ -56,11 +135,16 @@ class ConstructionEstimationAppV4:
                 label = f"{p['name']} ({p['room_count']} rooms, {p['floor_count']} floors)"
                 formatted_list.append([label, p['id']])
             
+            self._project_list_cache = formatted_list
             return formatted_list
         except Exception as e:
             print(f"Error getting projects: {e}")
             return [["Error loading projects", None]]
     
+    def _invalidate_project_cache(self):
+        """Drop the cached project list after a project is created or updated"""
+        self._project_list_cache = None
+    
     def load_project_details(self, project_choice: str) -> Dict:
         """Load selected project details into form fields"""
         if not project_choice or "No projects found" in project_choice or "Error" in project_choice:
@@ -77,6 +161,18 @@ class ConstructionEstimationAppV4:
             if not project_id:
                 return self._empty_project_form()
             
+            return self.load_project_details_by_id(project_id)
+            
+        except Exception as e:
+            print(f"Error loading project: {e}")
+            return self._empty_project_form()
+    
+    def load_project_details_by_id(self, project_id: int) -> Dict:
+        """Load project details for a known project ID without resolving a dropdown label"""
+        if not project_id:
+            return self._empty_project_form()
+        
+        try:
             self.current_project_id = project_id
             
             # Get project details
@@ -92,12 +188,9 @@ class ConstructionEstimationAppV4:
             
             # Get active rooms for proper counting
             active_rooms = self.project_service.get_active_rooms(self.current_project_id)
-            active_rooms_by_floor = {}
+            active_rooms_by_floor = defaultdict(list)
             for room in active_rooms:
-                floor_name = room['floor_name']
-                if floor_name not in active_rooms_by_floor:
-                    active_rooms_by_floor[floor_name] = []
-                active_rooms_by_floor[floor_name].append(room)
+                active_rooms_by_floor[room['floor_name']].append(room)
             
             # Generate project summary
             summary_lines = [
@@ -221,6 +314,8 @@ class ConstructionEstimationAppV4:
                 default_finishes,
                 default_trim
             )
+            if success:
+                self._invalidate_project_cache()
             
             # Refresh project list
             updated_choices = [c[0] for c in self.get_project_list_formatted()]
@@ -243,7 +338,8 @@ class ConstructionEstimationAppV4:
                               crown_molding: str, crown_molding_other: str,
                               yaml_content: str) -> Tuple[str, gr.Dropdown, Dict]:
         """Create new project with defaults and optional YAML"""
-        if not name.strip():
+        project_name = name.strip()
+        if not project_name:
             return "Error: Project name is required", gr.Dropdown(choices=[c[0] for c in self.get_project_list_formatted()]), {}
         
         try:
@@ -275,12 +371,13 @@ class ConstructionEstimationAppV4:
             
             # Create project
             project = self.project_service.create_project(
-                name.strip(), 
+                project_name, 
                 description.strip(),
                 default_finishes,
                 default_trim
             )
             self.current_project_id = project.id
+            self._invalidate_project_cache()
             
             status_msg = f"✅ Project '{name}' created successfully"
             
@@ -291,6 +388,7 @@ class ConstructionEstimationAppV4:
                 )
                 
                 if success:
+                    self._invalidate_room_cache()
                     status_msg += f"\n✅ {message}"
                 else:
                     status_msg += f"\n❌ YAML Error: {message}"
@@ -325,6 +423,7 @@ class ConstructionEstimationAppV4:
             )
             
             if success:
+                self._invalidate_room_cache()
                 summary_lines = [f"✅ {message}"]
                 for room in rooms:
                     summary_lines.append(f"📍 {room['floor']} - {room['room']}")
@@ -335,18 +434,32 @@ class ConstructionEstimationAppV4:
         except Exception as e:
             return f"Error uploading YAML: {str(e)}"
     
-    def get_room_choices(self) -> List[str]:
+    def _get_active_room_choices(self) -> Tuple[List[str], List[str]]:
+        """Get formatted active room choices and their lower-cased search keys, cached until rooms change"""
+        cache_key = (self.current_project_id, self._rooms_cache_version)
+        cached = self._room_choices_cache.get(cache_key)
+        if cached is None:
+            active_rooms = self.project_service.get_active_rooms(self.current_project_id)
+            room_choices = [f"{room['floor_name']} - {room['name']} (ID: {room['id']})" for room in active_rooms]
+            cached = (room_choices, [choice.lower() for choice in room_choices])
+            self._room_choices_cache[cache_key] = cached
+        
+        return cached
+    
+    def _invalidate_room_cache(self):
+        """Drop cached room choices after rooms are added, renamed or merged"""
+        self._rooms_cache_version += 1
+        self._room_choices_cache.clear()
+        # Project labels include room counts
+        self._invalidate_project_cache()
+    
+    def get_room_choices(self, query: str = "", limit: Optional[int] = None) -> List[str]:
         """Get active room choices for current project (excluding merged rooms)"""
         if not self.current_project_id:
             return []
         
         try:
-            active_rooms = self.project_service.get_active_rooms(self.current_project_id)
-            room_choices = []
-            for room in active_rooms:
-                room_choices.append(f"{room['floor_name']} - {room['name']} (ID: {room['id']})")
-            
-            return room_choices
+            return self._filter_room_choices(*self._get_active_room_choices(), query, limit)
             
         except Exception as e:
             print(f"Error getting room choices: {e}")
@@ -355,13 +468,15 @@ class ConstructionEstimationAppV4:
     def update_room_name(self, new_name: str) -> Tuple[str, gr.Dropdown]:
         """Update current room name and refresh dropdown"""
         if not self.current_room_id or not new_name.strip():
-            return "No room selected or empty name", gr.Dropdown(choices=self.get_room_choices())
+            return "No room selected or empty name", gr.Dropdown(choices=self.get_room_choices(limit=self.ROOM_CHOICE_LIMIT))
         
         try:
             success, message = self.project_service.update_room_name(self.current_room_id, new_name)
+            if success:
+                self._invalidate_room_cache()
             
             # Refresh room choices
-            updated_choices = self.get_room_choices()
+            updated_choices = self.get_room_choices(limit=self.ROOM_CHOICE_LIMIT)
             
             if success:
                 return f"✅ {message}", gr.Dropdown(choices=updated_choices)
@@ -369,7 +484,7 @@ class ConstructionEstimationAppV4:
                 return f"❌ {message}", gr.Dropdown(choices=updated_choices)
                 
         except Exception as e:
-            return f"Error: {str(e)}", gr.Dropdown(choices=self.get_room_choices())
+            return f"Error: {str(e)}", gr.Dropdown(choices=self.get_room_choices(limit=self.ROOM_CHOICE_LIMIT))
     
     def select_room_for_work_scope(self, room_choice: str) -> Dict:
         """Select room and load work scope form"""
@@ -508,44 +623,32 @@ class ConstructionEstimationAppV4:
         
         return "\n".join(lines)
     
-    def save_comprehensive_work_scope(self, use_defaults, flooring, wall_finish, ceiling_finish, paint_scope,
-                                    demod_floor, demod_floor_sf, demod_walls, demod_walls_sf,
-                                    demod_ceiling, demod_ceiling_sf, demod_wall_insulation, demod_wall_insulation_sf,
-                                    demod_ceiling_insulation, demod_ceiling_insulation_sf, demod_baseboard, demod_baseboard_lf,
-                                    removal_floor, removal_walls, removal_ceiling,
-                                    removal_wall_insulation, removal_ceiling_insulation, removal_baseboard,
-                                    remove_replace_data, detach_reset_data, protection_data, notes) -> str:
+    def save_work_scope_form(self, *form_values) -> str:
+        """Split the flat work scope form values into scope groups and save them"""
+        demod_end = 5 + len(DEMOD_SCOPE_FIELDS)
+        removal_end = demod_end + len(REMOVAL_SCOPE_FIELDS)
+        
+        use_defaults, flooring, wall_finish, ceiling_finish, paint_scope = form_values[:5]
+        demod = DemodScope(*form_values[5:demod_end])
+        removal = RemovalScope(*form_values[demod_end:removal_end])
+        remove_replace_data, detach_reset_data, protection_data, notes = form_values[removal_end:]
+        
+        return self.save_comprehensive_work_scope(
+            use_defaults, flooring, wall_finish, ceiling_finish, paint_scope,
+            demod, removal,
+            remove_replace_data, detach_reset_data, protection_data, notes
+        )
+    
+    def save_comprehensive_work_scope(self, use_defaults: bool, flooring: str, wall_finish: str,
+                                    ceiling_finish: str, paint_scope: str,
+                                    demod: DemodScope, removal: RemovalScope,
+                                    remove_replace_data: List, detach_reset_data: List,
+                                    protection_data: List, notes: str) -> str:
         """Save comprehensive work scope"""
         if not self.current_room_id:
             return "Error: No room selected"
         
         try:
-            # Build demo'd scope
-            demod_scope = {
-                'floor': demod_floor,
-                'floor_sf': demod_floor_sf if demod_floor == 'partial' else '',
-                'walls': demod_walls,
-                'walls_sf': demod_walls_sf if demod_walls == 'partial' else '',
-                'ceiling': demod_ceiling,
-                'ceiling_sf': demod_ceiling_sf if demod_ceiling == 'partial' else '',
-                'wall_insulation': demod_wall_insulation,
-                'wall_insulation_sf': demod_wall_insulation_sf if demod_wall_insulation == 'partial' else '',
-                'ceiling_insulation': demod_ceiling_insulation,
-                'ceiling_insulation_sf': demod_ceiling_insulation_sf if demod_ceiling_insulation == 'partial' else '',
-                'baseboard': demod_baseboard,
-                'baseboard_lf': demod_baseboard_lf if demod_baseboard == 'partial' else ''
-            }
-            
-            # Build removal scope
-            removal_scope = {
-                'floor': removal_floor,
-                'walls': removal_walls,
-                'ceiling': removal_ceiling,
-                'wall_insulation': removal_wall_insulation,
-                'ceiling_insulation': removal_ceiling_insulation,
-                'baseboard': removal_baseboard
-            }
-            
             # Build work scope data
             work_scope_data = {
                 'use_project_defaults': use_defaults,
@@ -553,8 +656,8 @@ class ConstructionEstimationAppV4:
                 'wall_finish_override': wall_finish.strip() if not use_defaults else None,
                 'ceiling_finish_override': ceiling_finish.strip() if not use_defaults else None,
                 'paint_scope': paint_scope,
-                'demod_scope': demod_scope,
-                'removal_scope': removal_scope,
+                'demod_scope': demod.to_dict(),
+                'removal_scope': removal.to_dict(),
                 'remove_replace_items': remove_replace_data,
                 'detach_reset_items': detach_reset_data,
                 'protection_items': protection_data,
@@ -571,38 +674,64 @@ class ConstructionEstimationAppV4:
         except Exception as e:
             return f"Error saving work scope: {str(e)}"
     
-    def export_project_yaml(self) -> Tuple[str, Optional[str]]:
-        """Export current project to YAML"""
+    def iter_export_project_yaml(self) -> Iterator[Tuple[str, str]]:
+        """Export current project to YAML, yielding progress status and then the full document once"""
         if not self.current_project_id:
-            return "Error: No project selected", None
+            yield "Error: No project selected", ""
+            return
         
+        chunks = []
         try:
-            yaml_content = self.project_service.export_project_to_yaml(self.current_project_id)
-            if yaml_content:
-                return "Project exported successfully", yaml_content
+            yield "Exporting project...", ""
+            for chunk in self.project_service.iter_export_project_to_yaml(self.current_project_id):
+                chunks.append(chunk)
+                # Only the status changes while exporting; the document is sent once at the end
+                yield f"Exporting project... ({len(chunks)} sections serialized)", ""
+            
+            if chunks:
+                yield "Project exported successfully", "".join(chunks)
             else:
-                return "Error exporting project", None
+                yield "Error exporting project", ""
                 
         except Exception as e:
-            return f"Error exporting project: {str(e)}", None
+            yield f"Error exporting project: {str(e)}", ""
     
-    def get_mergeable_rooms(self) -> List[str]:
+    def get_mergeable_rooms(self, query: str = "", limit: Optional[int] = None) -> List[str]:
         """Get list of active (non-merged) rooms that can be merged"""
         if not self.current_project_id:
             return []
         
         try:
-            active_rooms = self.project_service.get_active_rooms(self.current_project_id)
-            room_choices = []
-            for room in active_rooms:
-                room_choices.append(f"{room['floor_name']} - {room['name']} (ID: {room['id']})")
-            
-            return room_choices
+            return self._filter_room_choices(*self._get_active_room_choices(), query, limit)
             
         except Exception as e:
             print(f"Error getting mergeable rooms: {e}")
             return []
     
+    def _filter_room_choices(self, room_choices: List[str], lowered_choices: List[str],
+                             query: str, limit: Optional[int]) -> List[str]:
+        """Filter room choices server-side by case-insensitive substring and cap the result size"""
+        query = (query or "").strip().lower()
+        if query:
+            room_choices = [choice for choice, lowered in zip(room_choices, lowered_choices) if query in lowered]
+        
+        if limit is not None:
+            room_choices = room_choices[:limit]
+        
+        return room_choices
+    
+    def filter_room_choices(self, query: str) -> Dict:
+        """Update the room dropdown with rooms matching the search query"""
+        return gr.update(choices=self.get_room_choices(query, self.ROOM_SEARCH_LIMIT))
+    
+    def filter_mergeable_rooms(self, query: str, selected_rooms: List[str]) -> Dict:
+        """Update the merge dropdown with matching rooms, keeping the current selection available"""
+        selected_rooms = selected_rooms or []
+        matches = self.get_mergeable_rooms(query, self.ROOM_SEARCH_LIMIT)
+        selected_set = set(selected_rooms)
+        choices = selected_rooms + [room for room in matches if room not in selected_set]
+        return gr.update(choices=choices, value=selected_rooms)
+    
     def preview_room_merge(self, selected_rooms: List[str]) -> str:
         """Preview what the merged room will look like"""
         if not selected_rooms or len(selected_rooms) < 2:
@@ -613,11 +742,11 @@ class ConstructionEstimationAppV4:
         
         try:
             # Get room IDs from selected rooms
-            room_ids = []
+            room_ids = set()
             for room_choice in selected_rooms:
                 if "(ID: " in room_choice:
                     room_id_str = room_choice.split("(ID: ")[-1].rstrip(")")
-                    room_ids.append(int(room_id_str))
+                    room_ids.add(int(room_id_str))
             
             # Get room data
             project_data = self.project_service.get_project_with_rooms(self.current_project_id)
@@ -691,13 +820,12 @@ class ConstructionEstimationAppV4:
             value = value.strip()
             
             # Handle empty or 'n/a' values
-            if not value or value.lower() in ['n/a', 'na', '']:
+            if not value or value.lower() in ('n/a', 'na'):
                 return 0.0
             
             # Remove units: ft³, sq ft, LF, etc.
-            import re
             # Extract first number found in the string (including decimals)
-            match = re.search(r'\d+(?:,\d{3})*(?:\.\d+)?', value.replace(',', ''))
+            match = _MEASUREMENT_NUMBER_RE.search(value.replace(',', ''))
             if match:
                 return float(match.group().replace(',', ''))
             else:
@@ -705,16 +833,17 @@ class ConstructionEstimationAppV4:
         
         return 0.0
     
-    def merge_selected_rooms(self, selected_rooms: List[str], new_room_name: str) -> str:
-        """Merge selected rooms into one room"""
+    def merge_selected_rooms(self, selected_rooms: List[str], new_room_name: str) -> Tuple[bool, str]:
+        """Merge selected rooms into one room, returning (success, message)"""
         if not selected_rooms or len(selected_rooms) < 2:
-            return "Error: Please select at least 2 rooms to merge"
+            return False, "Error: Please select at least 2 rooms to merge"
         
-        if not new_room_name.strip():
-            return "Error: Please enter a name for the merged room"
+        new_room_name = new_room_name.strip()
+        if not new_room_name:
+            return False, "Error: Please enter a name for the merged room"
         
         if not self.current_project_id:
-            return "Error: No project selected"
+            return False, "Error: No project selected"
         
         try:
             # Get room IDs from selected rooms
@@ -727,15 +856,16 @@ class ConstructionEstimationAppV4:
             # Get room data
             project_data = self.project_service.get_project_with_rooms(self.current_project_id)
             if not project_data:
-                return "Error: Could not load project data"
+                return False, "Error: Could not load project data"
             
             # Find selected rooms
             selected_room_data = []
             floors_to_update = {}
+            room_id_set = set(room_ids)
             
             for floor in project_data['floors']:
                 for room in floor['rooms']:
-                    if room['id'] in room_ids:
+                    if room['id'] in room_id_set:
                         selected_room_data.append({
                             'floor': floor['name'],
                             'floor_id': floor['id'],
@@ -747,7 +877,7 @@ class ConstructionEstimationAppV4:
                             floors_to_update[floor['id']] = floor['name']
             
             if len(selected_room_data) < 2:
-                return "Error: Could not find selected rooms"
+                return False, "Error: Could not find selected rooms"
             
             # Calculate merged measurements
             merged_measurements = self._calculate_merged_measurements(selected_room_data)
@@ -756,7 +886,7 @@ class ConstructionEstimationAppV4:
             # Use the first room as base and update with merged data
             base_room = selected_room_data[0]['room']
             merged_room_data = {
-                'name': new_room_name.strip(),
+                'name': new_room_name,
                 'dimensions': f"Merged from {len(selected_room_data)} rooms",
                 'ceiling_height': base_room.get('ceiling_height', '8\''),
                 'measurements': merged_measurements
@@ -771,12 +901,13 @@ class ConstructionEstimationAppV4:
             )
             
             if success:
-                return f"✅ Successfully merged {len(selected_room_data)} rooms into '{new_room_name}'"
+                self._invalidate_room_cache()
+                return True, f"✅ Successfully merged {len(selected_room_data)} rooms into '{new_room_name}'"
             else:
-                return f"❌ Error merging rooms: {message}"
+                return False, f"❌ Error merging rooms: {message}"
                 
         except Exception as e:
-            return f"Error merging rooms: {str(e)}"
+            return False, f"Error merging rooms: {str(e)}"
     
     def _perform_room_merge(self, room_ids_to_delete: List[int], merged_room_data: Dict, target_floor_id: int) -> Tuple[bool, str]:
         """Perform the actual room merge operation using proper database operations"""
@@ -794,6 +925,54 @@ class ConstructionEstimationAppV4:
         except Exception as e:
             return False, str(e)
     
+    def _refresh_projects(self) -> Dict:
+        """Reload the project list from the database and refresh the dropdown"""
+        self._invalidate_project_cache()
+        return self._cached_project_choices()
+    
+    def _cached_project_choices(self) -> Dict:
+        """Populate the project dropdown from the cached project list"""
+        choices = [c[0] for c in self.get_project_list_formatted()]
+        return gr.update(choices=choices)
+    
+    def _refresh_merge_rooms(self) -> Dict:
+        """Refresh the merge room dropdown"""
+        rooms = self.get_mergeable_rooms(limit=self.ROOM_CHOICE_LIMIT)
+        return gr.update(choices=rooms)
+    
+    def _merge_rooms_and_refresh(self, selected_rooms: List[str], room_name: str) -> Tuple:
+        """Merge rooms and refresh all related UI components"""
+        # Perform the merge
+        merge_ok, merge_result = self.merge_selected_rooms(selected_rooms, room_name)
+        
+        # Refresh room-related dropdowns if merge was successful
+        if merge_ok:
+            # Get updated data
+            room_choices = self.get_room_choices(limit=self.ROOM_CHOICE_LIMIT)
+            mergeable_rooms = self.get_mergeable_rooms(limit=self.ROOM_CHOICE_LIMIT)
+        
+            # Get updated project info directly by ID (labels change with room counts)
+            project_info = self.load_project_details_by_id(self.current_project_id)['summary']
+        
+            return (
+                merge_result,  # merge_status
+                gr.update(choices=mergeable_rooms, value=[]),  # merge_room_dropdown (clear selection)
+                "",  # new_merged_room_name (clear input)
+                "",  # merge_preview (clear preview)
+                project_info,  # current_project_info
+                gr.update(choices=room_choices)  # room_dropdown
+            )
+        else:
+            # If merge failed, only update the status and leave other components untouched
+            return (
+                merge_result,  # merge_status
+                gr.update(),  # keep current selection
+                gr.update(),  # keep current name
+                gr.update(),  # keep current preview
+                gr.update(),  # keep current info
+                gr.update()  # keep current room dropdown
+            )
+    
     def create_dynamic_task_section(self, task_type: str, initial_items: List = None):
         """Create dynamic task input section"""
         if initial_items is None:
@@ -857,6 +1036,8 @@ class ConstructionEstimationAppV4:
     
     def create_interface(self) -> gr.Blocks:
         """Create the enhanced Gradio interface"""
+        if self._interface is not None:
+            return self._interface
         
         with gr.Blocks(title="Construction Estimation Manager V4", theme=gr.themes.Soft()) as interface:
             gr.Markdown("# 🏗️ Construction Estimation Manager")
@@ -1049,9 +1230,15 @@ class ConstructionEstimationAppV4:
                         with gr.Accordion("🔗 Merge Rooms", open=False):
                             gr.Markdown("*Combine multiple related rooms (e.g., Kitchen + Kitchen Bay Area)*")
                             
+                            merge_room_search = gr.Textbox(
+                                label="Search Rooms",
+                                placeholder="Type to filter rooms by floor or name..."
+                            )
+                            
                             with gr.Row():
                                 merge_room_dropdown = gr.Dropdown(
                                     label="Select Rooms to Merge",
+                                    info=f"Shows up to {self.ROOM_CHOICE_LIMIT} rooms - use search to find others",
                                     choices=[],
                                     multiselect=True,
                                     interactive=True
@@ -1100,8 +1287,13 @@ class ConstructionEstimationAppV4:
                     
                     with gr.Row():
                         with gr.Column(scale=1):
+                            room_search = gr.Textbox(
+                                label="Search Rooms",
+                                placeholder="Type to filter rooms by floor or name..."
+                            )
                             room_dropdown = gr.Dropdown(
                                 label="Select Room",
+                                info=f"Shows up to {self.ROOM_CHOICE_LIMIT} rooms - use search to find others",
                                 choices=[],
                                 interactive=True
                             )
@@ -1359,8 +1551,9 @@ class ConstructionEstimationAppV4:
             
             def add_task_item(items, item, quantity, unit):
                 """Add new task item"""
-                if item.strip():
-                    new_item = {'item': item.strip(), 'quantity': quantity, 'unit': unit}
+                item_name = item.strip()
+                if item_name:
+                    new_item = {'item': item_name, 'quantity': quantity, 'unit': unit}
                     updated_items = items + [new_item]
                     return updated_items, "", 1, "ea"
                 return items, item, quantity, unit
@@ -1483,10 +1676,10 @@ class ConstructionEstimationAppV4:
                 details = self.load_project_details(project_choice)
                 
                 # Update room dropdown
-                room_choices = self.get_room_choices()
+                room_choices = self.get_room_choices(limit=self.ROOM_CHOICE_LIMIT)
                 
                 # Update mergeable rooms dropdown
-                mergeable_rooms = self.get_mergeable_rooms()
+                mergeable_rooms = self.get_mergeable_rooms(limit=self.ROOM_CHOICE_LIMIT)
                 
                 # Determine if we have a project selected
                 has_project = details['form_visible']
@@ -1548,12 +1741,8 @@ class ConstructionEstimationAppV4:
             )
             
             # Refresh project list
-            def refresh_projects():
-                choices = [c[0] for c in self.get_project_list_formatted()]
-                return gr.Dropdown(choices=choices)
-            
             refresh_projects_btn.click(
-                fn=refresh_projects,
+                fn=self._refresh_projects,
                 outputs=[project_dropdown]
             )
             
@@ -1578,10 +1767,10 @@ class ConstructionEstimationAppV4:
                 status, dropdown, details = self.create_new_project_form(*args)
                 
                 # Update room dropdown
-                room_choices = self.get_room_choices()
+                room_choices = self.get_room_choices(limit=self.ROOM_CHOICE_LIMIT)
                 
                 # Update mergeable rooms dropdown
-                mergeable_rooms = self.get_mergeable_rooms()
+                mergeable_rooms = self.get_mergeable_rooms(limit=self.ROOM_CHOICE_LIMIT)
                 
                 # Determine if project was created successfully
                 has_project = details.get('form_visible', False)
@@ -1674,6 +1863,13 @@ class ConstructionEstimationAppV4:
                 outputs=[update_status, room_dropdown]
             )
             
+            # Filter room dropdown from search box
+            room_search.change(
+                fn=self.filter_room_choices,
+                inputs=[room_search],
+                outputs=[room_dropdown]
+            )
+            
             # Load room work scope
             def load_room_scope(room_choice):
                 form_data = self.select_room_for_work_scope(room_choice)
@@ -1794,43 +1990,46 @@ class ConstructionEstimationAppV4:
             )
             
             # Save comprehensive work scope
-            save_scope_btn.click(
-                fn=self.save_comprehensive_work_scope,
-                inputs=[
-                    use_defaults_checkbox, flooring_override, wall_finish_override,
-                    ceiling_finish_override, paint_scope,
-                    # Demo'd scope
-                    demod_floor, demod_floor_sf, demod_walls, demod_walls_sf,
-                    demod_ceiling, demod_ceiling_sf, demod_wall_insulation, demod_wall_insulation_sf,
-                    demod_ceiling_insulation, demod_ceiling_insulation_sf, demod_baseboard, demod_baseboard_lf,
-                    # Removal scope
-                    removal_floor, removal_walls, removal_ceiling,
-                    removal_wall_insulation, removal_ceiling_insulation, removal_baseboard,
-                    # Task lists
-                    remove_replace_state, detach_reset_state, protection_state,
-                    notes
-                ],
-                outputs=[save_work_status]
+            self._save_scope_inputs = (
+                use_defaults_checkbox, flooring_override, wall_finish_override,
+                ceiling_finish_override, paint_scope,
+                # Demo'd scope
+                demod_floor, demod_floor_sf, demod_walls, demod_walls_sf,
+                demod_ceiling, demod_ceiling_sf, demod_wall_insulation, demod_wall_insulation_sf,
+                demod_ceiling_insulation, demod_ceiling_insulation_sf, demod_baseboard, demod_baseboard_lf,
+                # Removal scope
+                removal_floor, removal_walls, removal_ceiling,
+                removal_wall_insulation, removal_ceiling_insulation, removal_baseboard,
+                # Task lists
+                remove_replace_state, detach_reset_state, protection_state,
+                notes
             )
             
-            # Export project
-            def export_project():
-                status, yaml_content = self.export_project_yaml()
-                return status, yaml_content or ""
+            save_scope_btn.click(
+                fn=self.save_work_scope_form,
+                inputs=list(self._save_scope_inputs),
+                outputs=[save_work_status],
+                concurrency_limit=1,
+                concurrency_id="save_scope"
+            )
             
+            # Export project, filling the code box floor by floor
             export_btn.click(
-                fn=export_project,
-                outputs=[export_status, exported_yaml]
+                fn=self.iter_export_project_yaml,
+                outputs=[export_status, exported_yaml],
+                concurrency_limit=1,
+                concurrency_id="export"
             )
             
             # Room merging event handlers
-            def refresh_merge_rooms():
-                """Refresh the merge room dropdown"""
-                rooms = self.get_mergeable_rooms()
-                return gr.Dropdown(choices=rooms)
-            
             refresh_merge_rooms_btn.click(
-                fn=refresh_merge_rooms,
+                fn=self._refresh_merge_rooms,
+                outputs=[merge_room_dropdown]
+            )
+            
+            merge_room_search.change(
+                fn=self.filter_mergeable_rooms,
+                inputs=[merge_room_search, merge_room_dropdown],
                 outputs=[merge_room_dropdown]
             )
             
@@ -1840,90 +2039,53 @@ class ConstructionEstimationAppV4:
                 outputs=[merge_preview]
             )
             
-            def merge_rooms_and_refresh(selected_rooms, room_name):
-                """Merge rooms and refresh all related UI components"""
-                # Perform the merge
-                merge_result = self.merge_selected_rooms(selected_rooms, room_name)
-                
-                # Refresh room-related dropdowns if merge was successful
-                if "✅" in merge_result:
-                    # Get updated data
-                    room_choices = self.get_room_choices()
-                    mergeable_rooms = self.get_mergeable_rooms()
-                    
-                    # Get updated project info
-                    if self.current_project_id:
-                        project_choice = None
-                        for label, pid in self.get_project_list_formatted():
-                            if pid == self.current_project_id:
-                                project_choice = label
-                                break
-                        
-                        if project_choice:
-                            details = self.load_project_details(project_choice)
-                            project_info = details['summary']
-                        else:
-                            project_info = "No project selected"
-                    else:
-                        project_info = "No project selected"
-                    
-                    return [
-                        merge_result,  # merge_status
-                        gr.Dropdown(choices=mergeable_rooms, value=[]),  # merge_room_dropdown (clear selection)
-                        "",  # new_merged_room_name (clear input)
-                        "",  # merge_preview (clear preview)
-                        project_info,  # current_project_info
-                        gr.Dropdown(choices=room_choices)  # room_dropdown
-                    ]
-                else:
-                    # If merge failed, just return the error message
-                    return [
-                        merge_result,  # merge_status
-                        merge_room_dropdown,  # keep current selection
-                        new_merged_room_name,  # keep current name
-                        merge_preview,  # keep current preview
-                        current_project_info,  # keep current info
-                        room_dropdown  # keep current room dropdown
-                    ]
-            
             merge_rooms_btn.click(
-                fn=merge_rooms_and_refresh,
+                fn=self._merge_rooms_and_refresh,
                 inputs=[merge_room_dropdown, new_merged_room_name],
                 outputs=[merge_status, merge_room_dropdown, new_merged_room_name, merge_preview, current_project_info, room_dropdown]
             )
             
             # Initialize project dropdown on load
             interface.load(
-                fn=refresh_projects,
+                fn=self._cached_project_choices,
                 outputs=[project_dropdown]
             )
         
+        # Bound the queue so slow saves/exports cannot starve the lightweight dropdown handlers
+        interface.queue(default_concurrency_limit=8, max_size=64)
+        
+        self._interface = interface
         return interface
 
 
 def main():
     """Main function to run the application"""
+    logging.basicConfig(
+        level=getattr(logging, config.LOG_LEVEL, logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    
     try:
         app = ConstructionEstimationAppV4()
         interface = app.create_interface()
         
-        print("Construction Estimation Manager V4 Starting...")
-        print("Database: SQLite")
-        print("Web Interface: http://localhost:7864")
-        print("Ready for comprehensive project management!")
+        logger.info("Construction Estimation Manager V4 Starting...")
+        logger.info("Database: SQLite")
+        logger.info("Web Interface: http://localhost:7864")
+        logger.info("Debug mode: %s", "on" if config.GRADIO_DEBUG else "off")
+        logger.info("Ready for comprehensive project management!")
         
+        # Gradio's debug mode and in-browser error details are development-only (GRADIO_DEBUG=True)
         interface.launch(
             server_name="0.0.0.0",
             server_port=7864,
             share=False,
-            debug=True,
-            show_error=True
+            debug=config.GRADIO_DEBUG,
+            show_error=config.GRADIO_DEBUG
         )
         
-    except Exception as e:
-        print(f"Error starting application: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error starting application")
 
 
 if __name__ == "__main__":
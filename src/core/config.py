@@ -30,10 +30,14 @@ class Config:
     
     # Gradio 설정
     GRADIO_SHARE = False  # 개발 중에는 False
-    GRADIO_DEBUG = True
+    # 디버그 모드는 요청마다 오버헤드가 있으므로 .env에서 명시적으로 켤 때만 사용
+    GRADIO_DEBUG = os.getenv('GRADIO_DEBUG', 'False').lower() == 'true'
+    
+    # 로깅 설정
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
     
     # 지원하는 이미지 포맷
-    ALLOWED_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff'}
+    ALLOWED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff'})
     
     # 최대 파일 크기 (MB)
     MAX_FILE_SIZE = 10
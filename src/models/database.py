@@ -2,7 +2,7 @@
 Database models for construction estimation project management
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import create_engine, Column, Integer, String, Float, Text, Boolean, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.sql import func
@@ -27,7 +27,7 @@ class Project(Base):
     default_trim = Column(JSON)      # baseboard, quarter_round, crown_molding
     
     # Relationships
-    floors = relationship("Floor", back_populates="project", cascade="all, delete-orphan")
+    floors = relationship("Floor", back_populates="project", cascade="all, delete-orphan", order_by="Floor.id")
     
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}')>"
@@ -36,6 +36,9 @@ class Project(Base):
 class Floor(Base):
     """Floor model (ground_floor, second_floor, etc.)"""
     __tablename__ = 'floors'
+    __table_args__ = (
+        Index('idx_floors_project_name', 'project_id', 'name'),
+    )
     
     id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey('projects.id'), nullable=False)
@@ -44,7 +47,7 @@ class Floor(Base):
     
     # Relationships
     project = relationship("Project", back_populates="floors")
-    rooms = relationship("Room", back_populates="floor", cascade="all, delete-orphan")
+    rooms = relationship("Room", back_populates="floor", cascade="all, delete-orphan", order_by="Room.id")
     
     def __repr__(self):
         return f"<Floor(id={self.id}, name='{self.name}')>"
@@ -53,6 +56,9 @@ class Floor(Base):
 class Room(Base):
     """Room model with measurements from YAML"""
     __tablename__ = 'rooms'
+    __table_args__ = (
+        Index('idx_rooms_floor_name', 'floor_id', 'name'),
+    )
     
     id = Column(Integer, primary_key=True)
     floor_id = Column(Integer, ForeignKey('floors.id'), nullable=False)
@@ -79,6 +85,9 @@ class Room(Base):
 class WorkScope(Base):
     """Work scope for each room"""
     __tablename__ = 'work_scopes'
+    __table_args__ = (
+        Index('idx_work_scopes_room', 'room_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     room_id = Column(Integer, ForeignKey('rooms.id'), nullable=False)
@@ -137,6 +146,11 @@ class DatabaseManager:
         
         # Create tables
         Base.metadata.create_all(bind=self.engine)
+        
+        # create_all skips existing tables, so add indexes missing from older databases
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
     
     def get_session(self):
         """Get database session"""
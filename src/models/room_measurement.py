@@ -3,6 +3,7 @@ Enhanced data models for room measurements and construction estimation
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Optional, Union
 from decimal import Decimal
 import re
@@ -239,6 +240,44 @@ class BulkProcessingResult:
         return (self.successful_extractions / self.total_images) * 100
 
 
+# Room type keywords in priority order; earlier room types win when several match
+_ROOM_TYPE_KEYWORDS = (
+    (RoomType.BEDROOM, ('bedroom', 'bed')),
+    (RoomType.BATHROOM, ('bathroom', 'bath')),
+    (RoomType.KITCHEN, ('kitchen', 'kit')),
+    (RoomType.LIVING_ROOM, ('living', 'family')),
+    (RoomType.DINING_ROOM, ('dining', 'din')),
+    (RoomType.OFFICE, ('office', 'study')),
+    (RoomType.CLOSET, ('closet', 'clo')),
+    (RoomType.HALLWAY, ('hallway', 'hall', 'corridor')),
+    (RoomType.ENTRY_FOYER, ('entry', 'foyer', 'entrance')),
+    (RoomType.GARAGE, ('garage', 'gar')),
+    (RoomType.BASEMENT, ('basement', 'cellar')),
+    (RoomType.ATTIC, ('attic', 'loft')),
+    (RoomType.LAUNDRY, ('laundry', 'utility')),
+)
+
+# Reverse map keyword -> (priority, room type)
+_KEYWORD_ROOM_TYPES = {
+    keyword: (priority, room_type)
+    for priority, (room_type, keywords) in enumerate(_ROOM_TYPE_KEYWORDS)
+    for keyword in keywords
+}
+
+# Lookahead alternation reporting every keyword hit, overlapping ones included, in one pass
+_ROOM_KEYWORD_SCANNER = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in _KEYWORD_ROOM_TYPES) + '))')
+
+
+@lru_cache(maxsize=4096)
+def _detect_room_type(name_lower: str) -> RoomType:
+    """Detect room type from a lower-cased name; room names repeat, so results are memoized"""
+    hits = [_KEYWORD_ROOM_TYPES[match.group(1)] for match in _ROOM_KEYWORD_SCANNER.finditer(name_lower)]
+    if not hits:
+        return RoomType.OTHER
+    
+    return min(hits, key=lambda hit: hit[0])[1]
+
+
 # Utility functions for measurement parsing
 class MeasurementParser:
     """Enhanced parser for construction measurements"""
@@ -355,33 +394,4 @@ class MeasurementParser:
     @classmethod
     def detect_room_type(cls, room_name: str) -> RoomType:
         """Detect room type from name"""
-        name_lower = room_name.lower()
-        
-        if any(word in name_lower for word in ['bedroom', 'bed']):
-            return RoomType.BEDROOM
-        elif any(word in name_lower for word in ['bathroom', 'bath']):
-            return RoomType.BATHROOM
-        elif any(word in name_lower for word in ['kitchen', 'kit']):
-            return RoomType.KITCHEN
-        elif any(word in name_lower for word in ['living', 'family']):
-            return RoomType.LIVING_ROOM
-        elif any(word in name_lower for word in ['dining', 'din']):
-            return RoomType.DINING_ROOM
-        elif any(word in name_lower for word in ['office', 'study']):
-            return RoomType.OFFICE
-        elif any(word in name_lower for word in ['closet', 'clo']):
-            return RoomType.CLOSET
-        elif any(word in name_lower for word in ['hallway', 'hall', 'corridor']):
-            return RoomType.HALLWAY
-        elif any(word in name_lower for word in ['entry', 'foyer', 'entrance']):
-            return RoomType.ENTRY_FOYER
-        elif any(word in name_lower for word in ['garage', 'gar']):
-            return RoomType.GARAGE
-        elif any(word in name_lower for word in ['basement', 'cellar']):
-            return RoomType.BASEMENT
-        elif any(word in name_lower for word in ['attic', 'loft']):
-            return RoomType.ATTIC
-        elif any(word in name_lower for word in ['laundry', 'utility']):
-            return RoomType.LAUNDRY
-        else:
-            return RoomType.OTHER
\ No newline at end of file
+        return _detect_room_type(room_name.lower())
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+JSON helpers shared by the data models and output formatters
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    # orjson parses JSON several times faster than the stdlib json module
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any, indent: Optional[int] = None, ensure_ascii: bool = True,
+               default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize data to a JSON string
+
+    Output always comes from the stdlib json module. orjson differs in number
+    format (1e-5 vs 1e-05), separators, datetime/enum handling, NaN and wide
+    integers, so using it here would make the same data serialize to different
+    bytes depending on whether it is installed.
+
+    Args:
+        data: Object to serialize
+        indent: Indent width, or None for compact output
+        ensure_ascii: Whether to escape non-ASCII characters
+        default: Fallback converter for unsupported types
+
+    Returns:
+        JSON string
+    """
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, default=default)
+
+
+def loads_json(content: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN and Infinity literals the stdlib writes
+            pass
+    return json.loads(content)
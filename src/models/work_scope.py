@@ -2,12 +2,13 @@
 Data models for construction estimation application
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Union
 from datetime import datetime
-import json
 import yaml
 
+from .serialization import dumps_json, loads_json
+
 
 @dataclass
 class Measurement:
@@ -22,7 +23,15 @@ class Measurement:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'type': self.type,
+            'value': dict(self.value) if isinstance(self.value, dict) else self.value,
+            'unit': self.unit,
+            'display': self.display,
+            'original_text': self.original_text,
+            'confidence': self.confidence,
+            'location': self.location
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'Measurement':
@@ -46,7 +55,18 @@ class WorkScope:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'category': self.category,
+            'description': self.description,
+            'unit_type': self.unit_type,
+            'base_rate': self.base_rate,
+            'labor_hours': self.labor_hours,
+            'material_factor': self.material_factor,
+            'complexity_factor': self.complexity_factor,
+            'keywords': list(self.keywords)
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'WorkScope':
@@ -69,11 +89,19 @@ class ProjectData:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization"""
-        data = asdict(self)
-        # Convert datetime objects to ISO format
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        return data
+        # Built field by field; asdict deep-copies every nested measurement and scope
+        return {
+            'project_id': self.project_id,
+            'name': self.name,
+            'description': self.description,
+            # Convert datetime objects to ISO format
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'measurements': [m.to_dict() for m in self.measurements],
+            'work_scopes': [w.to_dict() for w in self.work_scopes],
+            'mapping_results': {k: list(v) for k, v in self.mapping_results.items()},
+            'status': self.status
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'ProjectData':
@@ -104,7 +132,7 @@ class ProjectData:
     
     def to_json(self) -> str:
         """Export to JSON format"""
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps_json(self.to_dict(), indent=2)
     
     @classmethod
     def from_yaml(cls, yaml_content: str) -> 'ProjectData':
@@ -115,7 +143,7 @@ class ProjectData:
     @classmethod
     def from_json(cls, json_content: str) -> 'ProjectData':
         """Load from JSON content"""
-        data = json.loads(json_content)
+        data = loads_json(json_content)
         return cls.from_dict(data)
 
 
@@ -131,4 +159,11 @@ class UploadSession:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return asdict(self)
\ No newline at end of file
+        return {
+            'session_id': self.session_id,
+            'uploaded_files': list(self.uploaded_files),
+            'processed_measurements': [m.to_dict() for m in self.processed_measurements],
+            'selected_work_scopes': list(self.selected_work_scopes),
+            'status': self.status,
+            'error_message': self.error_message
+        }
\ No newline at end of file
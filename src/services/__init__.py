@@ -1,11 +1,30 @@
 """Service layer for the construction estimation application."""
 
+import threading
+
+# Singleton instances, created on first use
+_data_service = None
+_measurement_extractor = None
+
+# Gradio runs handlers concurrently, so creation is guarded to build each instance only once
+_factory_lock = threading.Lock()
+
 def get_data_service():
     """Factory function to get data service instance."""
-    from .data.persistence import DataService
-    return DataService()
+    global _data_service
+    if _data_service is None:
+        with _factory_lock:
+            if _data_service is None:
+                from .data.persistence import DataService
+                _data_service = DataService()
+    return _data_service
 
 def get_measurement_extractor():
     """Factory function to get measurement extractor instance."""
-    from .estimation.measurement_extractor import MeasurementExtractor
-    return MeasurementExtractor()
+    global _measurement_extractor
+    if _measurement_extractor is None:
+        with _factory_lock:
+            if _measurement_extractor is None:
+                from .estimation.measurement_extractor import MeasurementExtractor
+                _measurement_extractor = MeasurementExtractor()
+    return _measurement_extractor
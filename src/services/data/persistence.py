@@ -15,6 +15,13 @@ from models import ProjectData, Measurement, WorkScope, UploadSession
 
 logger = logging.getLogger(__name__)
 
+# Accepted spellings of the YAML file type
+_YAML_FILE_TYPES = frozenset({'yaml', 'yml'})
+
+# Fields every uploaded record must carry, checked in order so the first missing one is reported
+_MEASUREMENT_REQUIRED_FIELDS = ('type', 'value', 'unit', 'display', 'original_text', 'confidence')
+_WORK_SCOPE_REQUIRED_FIELDS = ('id', 'name', 'category', 'unit_type', 'base_rate')
+
 
 class DataService:
     """Service for data persistence and file operations"""
@@ -129,8 +136,9 @@ class DataService:
             project.updated_at = datetime.now()
             project_file = self.projects_dir / f"{project.project_id}.yaml"
             
+            # Emit straight into the file rather than rendering the whole document to a string first
             with open(project_file, 'w', encoding='utf-8') as f:
-                f.write(project.to_yaml())
+                yaml.dump(project.to_dict(), f, default_flow_style=False, sort_keys=False)
             
             logger.info(f"Project {project.project_id} saved successfully")
             return True
@@ -144,28 +152,33 @@ class DataService:
         try:
             project_file = self.projects_dir / f"{project_id}.yaml"
             
-            if not project_file.exists():
-                logger.warning(f"Project file not found: {project_id}")
+            # Open directly instead of stat-ing first; a missing file surfaces as FileNotFoundError
+            try:
+                with open(project_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                logger.warning("Project file not found: %s", project_id)
                 return None
             
-            with open(project_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
             project = ProjectData.from_yaml(content)
-            logger.info(f"Project {project_id} loaded successfully")
+            logger.info("Project %s loaded successfully", project_id)
             return project
             
         except Exception as e:
-            logger.error(f"Failed to load project {project_id}: {e}")
+            logger.error("Failed to load project %s: %s", project_id, e)
             return None
     
     def list_projects(self) -> List[Dict]:
         """List all projects with basic info"""
         projects = []
         
-        for project_file in self.projects_dir.glob("*.yaml"):
+        with os.scandir(self.projects_dir) as entries:
+            project_files = [entry.name for entry in entries
+                             if entry.name.endswith(".yaml") and entry.is_file()]
+        
+        for project_file in project_files:
             try:
-                project_id = project_file.stem
+                project_id = project_file[:-len(".yaml")]
                 project = self.load_project(project_id)
                 
                 if project:
@@ -180,7 +193,7 @@ class DataService:
                     })
                     
             except Exception as e:
-                logger.error(f"Error processing project file {project_file}: {e}")
+                logger.error("Error processing project file %s: %s", project_file, e)
         
         return sorted(projects, key=lambda x: x['created_at'], reverse=True)
     
@@ -208,13 +221,13 @@ class DataService:
         try:
             file_path = self.work_scopes_dir / f"{filename}.yaml"
             
-            if not file_path.exists():
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = yaml.safe_load(f)
+            except FileNotFoundError:
                 logger.warning(f"Work scopes file not found: {filename}")
                 return []
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
             work_scopes = [WorkScope.from_dict(scope_data) for scope_data in data['work_scopes']]
             logger.info(f"Loaded {len(work_scopes)} work scopes from {filename}")
             return work_scopes
@@ -229,7 +242,7 @@ class DataService:
         work_scopes = []
         
         try:
-            if file_type.lower() in ['yaml', 'yml']:
+            if file_type.lower() in _YAML_FILE_TYPES:
                 data = yaml.safe_load(file_content)
             elif file_type.lower() == 'json':
                 data = json.loads(file_content)
@@ -243,7 +256,7 @@ class DataService:
                         measurement = Measurement.from_dict(measurement_data)
                         measurements.append(measurement)
                     except Exception as e:
-                        logger.warning(f"Failed to parse measurement: {e}")
+                        logger.warning("Failed to parse measurement: %s", e)
             
             # Parse work scopes if present
             if 'work_scopes' in data:
@@ -252,7 +265,7 @@ class DataService:
                         work_scope = WorkScope.from_dict(scope_data)
                         work_scopes.append(work_scope)
                     except Exception as e:
-                        logger.warning(f"Failed to parse work scope: {e}")
+                        logger.warning("Failed to parse work scope: %s", e)
             
             logger.info(f"Parsed {len(measurements)} measurements and {len(work_scopes)} work scopes")
             
@@ -285,7 +298,7 @@ class DataService:
     def validate_data_format(self, file_content: str, file_type: str) -> Tuple[bool, str]:
         """Validate uploaded data format"""
         try:
-            if file_type.lower() in ['yaml', 'yml']:
+            if file_type.lower() in _YAML_FILE_TYPES:
                 data = yaml.safe_load(file_content)
             elif file_type.lower() == 'json':
                 data = json.loads(file_content)
@@ -305,8 +318,7 @@ class DataService:
                     if not isinstance(measurement, dict):
                         return False, f"measurement {i} must be a dictionary"
                     
-                    required_fields = ['type', 'value', 'unit', 'display', 'original_text', 'confidence']
-                    for field in required_fields:
+                    for field in _MEASUREMENT_REQUIRED_FIELDS:
                         if field not in measurement:
                             return False, f"measurement {i} missing required field: {field}"
             
@@ -319,8 +331,7 @@ class DataService:
                     if not isinstance(scope, dict):
                         return False, f"work_scope {i} must be a dictionary"
                     
-                    required_fields = ['id', 'name', 'category', 'unit_type', 'base_rate']
-                    for field in required_fields:
+                    for field in _WORK_SCOPE_REQUIRED_FIELDS:
                         if field not in scope:
                             return False, f"work_scope {i} missing required field: {field}"
             
@@ -12,14 +12,28 @@ logger = logging.getLogger(__name__)
 class MeasurementExtractor:
     """Extract and parse measurements from OCR text"""
     
+    # Measurement patterns, compiled once for every instance
+    PATTERNS = {
+        'feet_inches': re.compile(r"(\d+)'-?(\d+)?\"?", re.IGNORECASE),  # 10'-6", 10'6", 10'
+        'dimensions': re.compile(r"(\d+)\s*[xX]\s*(\d+)", re.IGNORECASE),  # 10x12, 10 x 12
+        'decimal_feet': re.compile(r"(\d+\.?\d*)\s*(?:ft|feet)", re.IGNORECASE),  # 10.5 ft
+        'inches': re.compile(r"(\d+\.?\d*)\s*(?:in|inches|\")", re.IGNORECASE),  # 12 in, 12"
+        'area': re.compile(r"(\d+\.?\d*)\s*(?:sq ft|sqft|sf)", re.IGNORECASE),  # 100 sq ft
+    }
+    
     def __init__(self):
         """Initialize measurement patterns"""
-        self.patterns = {
-            'feet_inches': r"(\d+)'-?(\d+)?\"?",  # 10'-6", 10'6", 10'
-            'dimensions': r"(\d+)\s*[xX]\s*(\d+)",  # 10x12, 10 x 12
-            'decimal_feet': r"(\d+\.?\d*)\s*(?:ft|feet)",  # 10.5 ft
-            'inches': r"(\d+\.?\d*)\s*(?:in|inches|\")",  # 12 in, 12"
-            'area': r"(\d+\.?\d*)\s*(?:sq ft|sqft|sf)",  # 100 sq ft
+        # Per-instance copy so changes to one extractor's patterns do not leak into others;
+        # the compiled patterns themselves are shared
+        self.patterns = dict(self.PATTERNS)
+        
+        # Parser for each pattern, looked up once per match instead of walking an if/elif chain
+        self._parsers = {
+            'feet_inches': self._parse_feet_inches,
+            'dimensions': self._parse_dimensions,
+            'decimal_feet': self._parse_decimal_feet,
+            'inches': self._parse_inches,
+            'area': self._parse_area,
         }
     
     def extract_measurements(self, ocr_results: List[Dict]) -> List[Dict]:
@@ -32,7 +46,7 @@ class MeasurementExtractor:
             
             # Try each pattern
             for pattern_name, pattern in self.patterns.items():
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 
                 for match in matches:
                     measurement = self._parse_measurement(match, pattern_name, text, confidence)
@@ -43,67 +57,78 @@ class MeasurementExtractor:
     
     def _parse_measurement(self, match, pattern_name: str, original_text: str, confidence: float) -> Optional[Dict]:
         """Parse a specific measurement match"""
+        parser = self._parsers.get(pattern_name)
+        if parser is None:
+            return None
+        
         try:
-            if pattern_name == 'feet_inches':
-                feet = int(match.group(1))
-                inches = int(match.group(2)) if match.group(2) else 0
-                total_inches = feet * 12 + inches
-                return {
-                    'type': 'length',
-                    'value': total_inches,
-                    'unit': 'inches',
-                    'display': f"{feet}'-{inches}\"",
-                    'original_text': original_text,
-                    'confidence': confidence
-                }
-            
-            elif pattern_name == 'dimensions':
-                width = float(match.group(1))
-                height = float(match.group(2))
-                return {
-                    'type': 'dimension',
-                    'width': width,
-                    'height': height,
-                    'area': width * height,
-                    'display': f"{width} x {height}",
-                    'original_text': original_text,
-                    'confidence': confidence
-                }
-            
-            elif pattern_name == 'decimal_feet':
-                feet = float(match.group(1))
-                inches = feet * 12
-                return {
-                    'type': 'length',
-                    'value': inches,
-                    'unit': 'inches',
-                    'display': f"{feet} ft",
-                    'original_text': original_text,
-                    'confidence': confidence
-                }
-            
-            elif pattern_name == 'inches':
-                inches = float(match.group(1))
-                return {
-                    'type': 'length',
-                    'value': inches,
-                    'unit': 'inches',
-                    'display': f"{inches}\"",
-                    'original_text': original_text,
-                    'confidence': confidence
-                }
-            
-            elif pattern_name == 'area':
-                area = float(match.group(1))
-                return {
-                    'type': 'area',
-                    'value': area,
-                    'unit': 'sq_ft',
-                    'display': f"{area} sq ft",
-                    'original_text': original_text,
-                    'confidence': confidence
-                }
+            return parser(match, original_text, confidence)
                 
         except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to parse measurement: {e}")
-            return None
\ No newline at end of file
+            logger.warning("Failed to parse measurement: %s", e)
+            return None
+    
+    def _parse_feet_inches(self, match, original_text: str, confidence: float) -> Dict:
+        """Parse a feet-inches match such as 10'-6\" into total inches"""
+        feet = int(match.group(1))
+        inches = int(match.group(2)) if match.group(2) else 0
+        total_inches = feet * 12 + inches
+        return {
+            'type': 'length',
+            'value': total_inches,
+            'unit': 'inches',
+            'display': f"{feet}'-{inches}\"",
+            'original_text': original_text,
+            'confidence': confidence
+        }
+    
+    def _parse_dimensions(self, match, original_text: str, confidence: float) -> Dict:
+        """Parse a width x height match"""
+        width = float(match.group(1))
+        height = float(match.group(2))
+        return {
+            'type': 'dimension',
+            'width': width,
+            'height': height,
+            'area': width * height,
+            'display': f"{width} x {height}",
+            'original_text': original_text,
+            'confidence': confidence
+        }
+    
+    def _parse_decimal_feet(self, match, original_text: str, confidence: float) -> Dict:
+        """Parse a decimal feet match into inches"""
+        feet = float(match.group(1))
+        inches = feet * 12
+        return {
+            'type': 'length',
+            'value': inches,
+            'unit': 'inches',
+            'display': f"{feet} ft",
+            'original_text': original_text,
+            'confidence': confidence
+        }
+    
+    def _parse_inches(self, match, original_text: str, confidence: float) -> Dict:
+        """Parse an inches match"""
+        inches = float(match.group(1))
+        return {
+            'type': 'length',
+            'value': inches,
+            'unit': 'inches',
+            'display': f"{inches}\"",
+            'original_text': original_text,
+            'confidence': confidence
+        }
+    
+    def _parse_area(self, match, original_text: str, confidence: float) -> Dict:
+        """Parse a square feet area match"""
+        area = float(match.group(1))
+        return {
+            'type': 'area',
+            'value': area,
+            'unit': 'sq_ft',
+            'display': f"{area} sq ft",
+            'original_text': original_text,
+            'confidence': confidence
+        }
\ No newline at end of file
@@ -1,13 +1,38 @@
 """
 Measurement extraction services for construction estimation.
+
+Submodules are imported on first attribute access (PEP 562) so that importing
+the package does not pull in the parser and YAML formatter until they are used.
 """
 
-from .construction_parser import ConstructionMeasurementParser, get_construction_parser
-from .yaml_formatter import ConstructionYAMLFormatter, get_yaml_formatter
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'ConstructionMeasurementParser': 'construction_parser',
+    'get_construction_parser': 'construction_parser',
+    'ConstructionYAMLFormatter': 'yaml_formatter',
+    'get_yaml_formatter': 'yaml_formatter',
+}
 
 __all__ = [
     'ConstructionMeasurementParser',
     'get_construction_parser',
     'ConstructionYAMLFormatter', 
     'get_yaml_formatter'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access and cache the attribute"""
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include lazily exported names in dir() output"""
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
@@ -10,6 +10,61 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Image file extensions stripped from filenames before room detection
+_IMAGE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+
+# Room name patterns, compiled once and tried in order
+_ROOM_NAME_PATTERNS = [
+    re.compile(r"^([A-Za-z\s]+?)(?:\s*-\s*.*)?$", re.IGNORECASE),  # Extract main room name before dash
+    re.compile(r"room:\s*([A-Za-z\s]+)", re.IGNORECASE),  # Room: Hallway
+    re.compile(r"([A-Za-z\s]+)(?:\s+area)?$", re.IGNORECASE),  # Hallway, Bedroom area
+]
+
+# Ceiling height patterns, compiled once and tried in order
+_HEIGHT_PATTERNS = [
+    re.compile(r"ceiling\s*height\s*(\d+)'?", re.IGNORECASE),
+    re.compile(r"height\s*(\d+)'?", re.IGNORECASE),
+    re.compile(r"(\d+)'\s*ceiling", re.IGNORECASE),
+    re.compile(r"(\d+)'\s*high", re.IGNORECASE),
+]
+
+# Group i + 1 of the fused scanner must be pattern i's value, so each pattern captures exactly once
+if any(pattern.groups != 1 for pattern in _HEIGHT_PATTERNS):
+    raise ValueError("Each height pattern must have exactly one capture group")
+
+# All height patterns fused into one lookahead alternation; lastindex tells which pattern matched
+_HEIGHT_SCANNER = re.compile('(?=' + '|'.join(p.pattern for p in _HEIGHT_PATTERNS) + ')', re.IGNORECASE)
+
+# Room keywords in priority order; the earliest listed keyword found wins
+_TEXT_ROOM_TYPES = (
+    'hallway', 'bedroom', 'bathroom', 'kitchen', 'living room', 'dining room',
+    'office', 'closet', 'basement', 'attic', 'garage', 'laundry', 'entry',
+    'foyer', 'family room', 'den', 'study', 'pantry'
+)
+_FILENAME_ROOM_TYPES = (
+    'hallway', 'bedroom', 'bathroom', 'kitchen', 'living', 'dining',
+    'office', 'closet', 'basement', 'attic', 'garage', 'laundry'
+)
+
+
+def _compile_keyword_scanner(keywords) -> re.Pattern:
+    """Compile keywords into one lookahead alternation that reports overlapping hits in a single pass"""
+    return re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))')
+
+
+def _find_first_keyword(scanner: re.Pattern, priorities: Dict[str, int], text: str) -> Optional[str]:
+    """Return the highest-priority keyword found anywhere in text"""
+    hits = {match.group(1) for match in scanner.finditer(text)}
+    if not hits:
+        return None
+    return min(hits, key=priorities.__getitem__)
+
+
+_TEXT_ROOM_SCANNER = _compile_keyword_scanner(_TEXT_ROOM_TYPES)
+_TEXT_ROOM_PRIORITY = {keyword: i for i, keyword in enumerate(_TEXT_ROOM_TYPES)}
+_FILENAME_ROOM_SCANNER = _compile_keyword_scanner(_FILENAME_ROOM_TYPES)
+_FILENAME_ROOM_PRIORITY = {keyword: i for i, keyword in enumerate(_FILENAME_ROOM_TYPES)}
+
 
 @dataclass
 class RoomMeasurement:
@@ -56,11 +111,7 @@ class ConstructionMeasurementParser:
         }
         
         # Room name patterns
-        self.room_patterns = [
-            r"^([A-Za-z\s]+?)(?:\s*-\s*.*)?$",  # Extract main room name before dash
-            r"room:\s*([A-Za-z\s]+)",  # Room: Hallway
-            r"([A-Za-z\s]+)(?:\s+area)?$",  # Hallway, Bedroom area
-        ]
+        self.room_patterns = _ROOM_NAME_PATTERNS
     
     def parse_construction_image(self, ocr_results: List[Dict], image_filename: Optional[str] = None) -> RoomMeasurement:
         """
@@ -108,19 +159,13 @@ class ConstructionMeasurementParser:
         text_lower = text.lower()
         
         # Common room types
-        room_types = [
-            'hallway', 'bedroom', 'bathroom', 'kitchen', 'living room', 'dining room',
-            'office', 'closet', 'basement', 'attic', 'garage', 'laundry', 'entry',
-            'foyer', 'family room', 'den', 'study', 'pantry'
-        ]
-        
-        for room_type in room_types:
-            if room_type in text_lower:
-                return room_type.title()
+        room_type = _find_first_keyword(_TEXT_ROOM_SCANNER, _TEXT_ROOM_PRIORITY, text_lower)
+        if room_type:
+            return room_type.title()
         
         # Try pattern matching
         for pattern in self.room_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip().title()
         
@@ -129,34 +174,28 @@ class ConstructionMeasurementParser:
     def _extract_room_from_filename(self, filename: str) -> Optional[str]:
         """Extract room name from filename"""
         name = filename.lower()
-        name = re.sub(r'\.(jpg|jpeg|png|bmp|tiff)$', '', name)
+        if name.endswith(_IMAGE_SUFFIXES):
+            name = name[:name.rindex('.')]
         
-        room_types = [
-            'hallway', 'bedroom', 'bathroom', 'kitchen', 'living', 'dining',
-            'office', 'closet', 'basement', 'attic', 'garage', 'laundry'
-        ]
-        
-        for room_type in room_types:
-            if room_type in name:
-                return room_type.title()
+        room_type = _find_first_keyword(_FILENAME_ROOM_SCANNER, _FILENAME_ROOM_PRIORITY, name)
+        if room_type:
+            return room_type.title()
         
         return None
     
     def _extract_height(self, text: str) -> Optional[str]:
         """Extract ceiling height from text"""
-        # Look for ceiling height patterns
-        patterns = [
-            r"ceiling\s*height\s*(\d+)'?",
-            r"height\s*(\d+)'?",
-            r"(\d+)'\s*ceiling",
-            r"(\d+)'\s*high"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                height = match.group(1)
-                return f"{height}'"
+        # Single pass over the text; the earliest listed pattern wins, at its leftmost match
+        best_match = None
+        for match in _HEIGHT_SCANNER.finditer(text):
+            if best_match is None or match.lastindex < best_match.lastindex:
+                best_match = match
+                if best_match.lastindex == 1:
+                    break
+        
+        if best_match:
+            height = best_match.group(best_match.lastindex)
+            return f"{height}'"
         
         return None
     
@@ -9,6 +9,7 @@ from typing import List, Dict, Optional, Tuple, Union
 from decimal import Decimal
 import re
 import json
+import importlib.util
 from datetime import datetime
 
 from models.room_measurement import (
@@ -19,15 +20,32 @@ from models.room_measurement import (
 
 logger = logging.getLogger(__name__)
 
-try:
-    # Import OpenAI for complex parsing fallback
-    import openai
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI is used for the complex parsing fallback. Only check that it is installed here;
+# the package itself is imported when a client is first created, keeping module import cheap
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available. Complex parsing will be limited.")
 
+# Patterns used on every extraction, compiled once at import
+_FILENAME_SEPARATOR_RE = re.compile(r'[_\-]')
+_SUBROOM_PATTERNS = [
+    re.compile(r'master\s*(\w+)', re.IGNORECASE),
+    re.compile(r'(\w+)\s*\d+', re.IGNORECASE),
+    re.compile(r'(\w+)\s*[abc]', re.IGNORECASE),
+]
+_ROOM_NAME_RE = re.compile(r'(?:room|location):\s*([A-Z_][A-Z_\s\-]*)', re.IGNORECASE)
+_HEIGHT_RE = re.compile(r'(?:height|h):\s*(\d+(?:\.\d+)?(?:\'[\s\-]*\d+(?:\s*\d+/\d+)?\"?)?)', re.IGNORECASE)
+_WALL_AREA_RE = re.compile(r'wall.*area:\s*(\d+\.?\d*)\s*sf', re.IGNORECASE)
+_CEILING_AREA_RE = re.compile(r'ceiling.*area:\s*(\d+\.?\d*)\s*sf', re.IGNORECASE)
+_CEILING_PERIMETER_RE = re.compile(r'ceiling\s*perimeter.*length:\s*(\d+\.?\d*)\s*lf', re.IGNORECASE)
+_FLOOR_AREA_RE = re.compile(r'floor.*area:\s*(\d+\.?\d*)\s*sf', re.IGNORECASE)
+_FLOOR_PERIMETER_RE = re.compile(r'(?:floor\s*)?perimeter:\s*(\d+\.?\d*)\s*lf', re.IGNORECASE)
+_FLOORING_RE = re.compile(r'flooring:\s*(\d+\.?\d*)\s*sy', re.IGNORECASE)
+_DOOR_RE = re.compile(r'(?:door|opening).*?dimensions?:\s*(\d+(?:\'[\s\-]*\d+\"?)?)\s*[xX×]\s*(\d+(?:\'[\s\-]*\d+\"?)?)', re.IGNORECASE)
+_MISSING_WALL_RE = re.compile(r'missing\s+wall.*?dimensions?:\s*(\d+(?:\'[\s\-]*\d+(?:\s*\d+/\d+)?\"?)?)\s*[xX×]\s*(\d+(?:\'[\s\-]*\d+\"?)?)', re.IGNORECASE)
+_OPENS_INTO_RE = re.compile(r'opens?\s+into:\s*([A-Z_][A-Z_\s]*)', re.IGNORECASE)
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
 
 class AdvancedMeasurementExtractor:
     """Advanced measurement extraction with multiple parsing strategies"""
@@ -43,11 +61,14 @@ class AdvancedMeasurementExtractor:
         self.openai_client = None
         
         if OPENAI_AVAILABLE and openai_api_key:
+            from openai import OpenAI
             self.openai_client = OpenAI(api_key=openai_api_key)
             logger.info("OpenAI client initialized for complex parsing")
         
         # Load room name mapping patterns
         self.room_patterns = self._load_room_patterns()
+        self._room_types = list(self.room_patterns.values())
+        self._room_scanner = self._compile_room_scanner()
     
     def _load_room_patterns(self) -> Dict[str, RoomType]:
         """Load room name patterns for detection"""
@@ -94,6 +115,16 @@ class AdvancedMeasurementExtractor:
             r'utility': RoomType.LAUNDRY,
         }
     
+    def _compile_room_scanner(self) -> re.Pattern:
+        """Fuse room patterns into one lookahead alternation with a capture group per pattern, in priority order"""
+        # Group i + 1 must belong to pattern i, so the source patterns may not capture anything themselves
+        for pattern in self.room_patterns:
+            if re.compile(pattern).groups:
+                raise ValueError(f"Room pattern must not contain capture groups: {pattern!r}")
+        
+        alternatives = '|'.join(f'({pattern})' for pattern in self.room_patterns)
+        return re.compile(f'(?=(?:{alternatives}))', re.IGNORECASE)
+    
     def extract_room_from_filename(self, filename: str) -> Tuple[str, RoomType, str]:
         """
         Extract room information from filename
@@ -106,29 +137,26 @@ class AdvancedMeasurementExtractor:
         """
         # Clean filename
         name = Path(filename).stem.lower()
-        name = re.sub(r'[_\-]', ' ', name)
+        name = _FILENAME_SEPARATOR_RE.sub(' ', name)
         
         # Look for room patterns
         room_name = "Unknown Room"
         room_type = RoomType.OTHER
         subroom = ""
         
-        for pattern, rtype in self.room_patterns.items():
-            match = re.search(pattern, name, re.IGNORECASE)
-            if match:
-                room_name = match.group(0).title()
-                room_type = rtype
-                break
+        # Single pass over the name; the earliest listed pattern wins, at its leftmost match
+        best_match = None
+        for match in self._room_scanner.finditer(name):
+            if best_match is None or match.lastindex < best_match.lastindex:
+                best_match = match
+        
+        if best_match:
+            room_name = best_match.group(best_match.lastindex).title()
+            room_type = self._room_types[best_match.lastindex - 1]
         
         # Look for subroom indicators
-        subroom_patterns = [
-            r'master\s*(\w+)',
-            r'(\w+)\s*\d+',
-            r'(\w+)\s*[abc]'
-        ]
-        
-        for pattern in subroom_patterns:
-            match = re.search(pattern, name, re.IGNORECASE)
+        for pattern in _SUBROOM_PATTERNS:
+            match = pattern.search(name)
             if match and match.group(1).lower() not in ['room', 'bath']:
                 subroom = match.group(1).title()
                 break
@@ -152,18 +180,18 @@ class AdvancedMeasurementExtractor:
         room = RoomMeasurement(room_name="Unknown Room")
         
         # Extract room name from OCR if present
-        room_match = re.search(r'(?:room|location):\s*([A-Z_][A-Z_\s\-]*)', full_text, re.IGNORECASE)
+        room_match = _ROOM_NAME_RE.search(full_text)
         if room_match:
             room.room_name = room_match.group(1).strip().title()
             room.room_type = self.parser.detect_room_type(room.room_name)
         
         # Extract height
-        height_match = re.search(r'(?:height|h):\s*(\d+(?:\.\d+)?(?:\'[\s\-]*\d+(?:\s*\d+/\d+)?\"?)?)', full_text, re.IGNORECASE)
+        height_match = _HEIGHT_RE.search(full_text)
         if height_match:
             room.height = self.parser.parse_dimension(height_match.group(1))
         
         # Extract wall measurements
-        wall_area_match = re.search(r'wall.*area:\s*(\d+\.?\d*)\s*sf', full_text, re.IGNORECASE)
+        wall_area_match = _WALL_AREA_RE.search(full_text)
         if wall_area_match:
             if not room.walls:
                 room.walls = WallMeasurement()
@@ -174,7 +202,7 @@ class AdvancedMeasurementExtractor:
             )
         
         # Extract ceiling measurements
-        ceiling_area_match = re.search(r'ceiling.*area:\s*(\d+\.?\d*)\s*sf', full_text, re.IGNORECASE)
+        ceiling_area_match = _CEILING_AREA_RE.search(full_text)
         if ceiling_area_match:
             if not room.ceiling:
                 room.ceiling = CeilingMeasurement()
@@ -184,7 +212,7 @@ class AdvancedMeasurementExtractor:
                 original_text=ceiling_area_match.group(0)
             )
         
-        ceiling_perimeter_match = re.search(r'ceiling\s*perimeter.*length:\s*(\d+\.?\d*)\s*lf', full_text, re.IGNORECASE)
+        ceiling_perimeter_match = _CEILING_PERIMETER_RE.search(full_text)
         if ceiling_perimeter_match:
             if not room.ceiling:
                 room.ceiling = CeilingMeasurement()
@@ -195,7 +223,7 @@ class AdvancedMeasurementExtractor:
             )
         
         # Extract floor measurements
-        floor_area_match = re.search(r'floor.*area:\s*(\d+\.?\d*)\s*sf', full_text, re.IGNORECASE)
+        floor_area_match = _FLOOR_AREA_RE.search(full_text)
         if floor_area_match:
             if not room.floor:
                 room.floor = FloorMeasurement()
@@ -205,7 +233,7 @@ class AdvancedMeasurementExtractor:
                 original_text=floor_area_match.group(0)
             )
         
-        floor_perimeter_match = re.search(r'(?:floor\s*)?perimeter:\s*(\d+\.?\d*)\s*lf', full_text, re.IGNORECASE)
+        floor_perimeter_match = _FLOOR_PERIMETER_RE.search(full_text)
         if floor_perimeter_match:
             if not room.floor:
                 room.floor = FloorMeasurement()
@@ -215,7 +243,7 @@ class AdvancedMeasurementExtractor:
                 original_text=floor_perimeter_match.group(0)
             )
         
-        flooring_match = re.search(r'flooring:\s*(\d+\.?\d*)\s*sy', full_text, re.IGNORECASE)
+        flooring_match = _FLOORING_RE.search(full_text)
         if flooring_match:
             if not room.floor:
                 room.floor = FloorMeasurement()
@@ -226,17 +254,15 @@ class AdvancedMeasurementExtractor:
             )
         
         # Extract door openings
-        door_pattern = r'(?:door|opening).*?dimensions?:\s*(\d+(?:\'[\s\-]*\d+\"?)?)\s*[xX×]\s*(\d+(?:\'[\s\-]*\d+\"?)?)'
-        for door_match in re.finditer(door_pattern, full_text, re.IGNORECASE):
+        for door_match in _DOOR_RE.finditer(full_text):
             width = self.parser.parse_dimension(door_match.group(1))
             height = self.parser.parse_dimension(door_match.group(2))
             
             if width and height:
                 # Look for "opens into" in the surrounding text
                 opens_into = "Unknown"
-                opens_pattern = r'opens?\s+into:\s*([A-Z_][A-Z_\s]*)'
                 surrounding_text = full_text[max(0, door_match.start()-100):door_match.end()+100]
-                opens_match = re.search(opens_pattern, surrounding_text, re.IGNORECASE)
+                opens_match = _OPENS_INTO_RE.search(surrounding_text)
                 if opens_match:
                     opens_into = opens_match.group(1).strip()
                 
@@ -250,17 +276,15 @@ class AdvancedMeasurementExtractor:
                 room.doors.append(door)
         
         # Extract missing walls
-        missing_wall_pattern = r'missing\s+wall.*?dimensions?:\s*(\d+(?:\'[\s\-]*\d+(?:\s*\d+/\d+)?\"?)?)\s*[xX×]\s*(\d+(?:\'[\s\-]*\d+\"?)?)'
-        for wall_match in re.finditer(missing_wall_pattern, full_text, re.IGNORECASE):
+        for wall_match in _MISSING_WALL_RE.finditer(full_text):
             width = self.parser.parse_dimension(wall_match.group(1))
             height = self.parser.parse_dimension(wall_match.group(2))
             
             if width and height:
                 # Look for "opens into" in the surrounding text
                 opens_into = "Unknown"
-                opens_pattern = r'opens?\s+into:\s*([A-Z_][A-Z_\s]*)'
                 surrounding_text = full_text[max(0, wall_match.start()-100):wall_match.end()+100]
-                opens_match = re.search(opens_pattern, surrounding_text, re.IGNORECASE)
+                opens_match = _OPENS_INTO_RE.search(surrounding_text)
                 if opens_match:
                     opens_into = opens_match.group(1).strip()
                 
@@ -356,7 +380,7 @@ class AdvancedMeasurementExtractor:
             response_text = response.choices[0].message.content.strip()
             
             # Extract JSON from response (handle potential markdown formatting)
-            json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+            json_match = _JSON_BLOCK_RE.search(response_text)
             if json_match:
                 response_text = json_match.group(1)
             elif response_text.startswith('```') and response_text.endswith('```'):
@@ -6,6 +6,7 @@ import os
 import logging
 from typing import List, Dict, Optional, Any
 from pathlib import Path
+from collections import Counter
 from decimal import Decimal
 import json
 import yaml
@@ -16,9 +17,13 @@ from models.room_measurement import (
     RoomMeasurement, BulkProcessingResult, WallMeasurement, 
     CeilingMeasurement, FloorMeasurement, DoorOpening, WindowOpening, MissingWall
 )
+from models.serialization import dumps_json
 
 logger = logging.getLogger(__name__)
 
+# Characters invalid in file names, each replaced with '_' in a single translate pass
+_INVALID_FILENAME_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 
 class MeasurementOutputFormatter:
     """Formats measurement data into various output formats"""
@@ -168,12 +173,8 @@ class MeasurementOutputFormatter:
         Returns:
             JSON string
         """
-        data = self._room_to_dict(room)
-        
-        if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False, default=str)
-        else:
-            return json.dumps(data, ensure_ascii=False, default=str)
+        return dumps_json(self._room_to_dict(room), indent=2 if pretty else None,
+                          ensure_ascii=False, default=str)
     
     def format_room_yaml(self, room: RoomMeasurement) -> str:
         """
@@ -214,6 +215,7 @@ class MeasurementOutputFormatter:
         
         # Data rows
         for room in results.room_measurements:
+            total_area = room.get_total_wall_ceiling_area()
             row = [
                 room.room_name,
                 room.room_type.value if room.room_type else '',
@@ -225,7 +227,7 @@ class MeasurementOutputFormatter:
                 float(room.floor.perimeter.value) if room.floor and room.floor.perimeter else '',
                 float(room.floor.flooring_area.to_square_yards()) if room.floor and room.floor.flooring_area else '',
                 float(room.ceiling.perimeter.value) if room.ceiling and room.ceiling.perimeter else '',
-                float(room.get_total_wall_ceiling_area()) if room.get_total_wall_ceiling_area() else '',
+                float(total_area) if total_area else '',
                 len(room.doors),
                 len(room.windows),
                 len(room.missing_walls),
@@ -307,8 +309,8 @@ class MeasurementOutputFormatter:
                     
                 elif format_type == 'json':
                     filename = f"measurement_results_{timestamp}.json"
-                    content = json.dumps(self._bulk_results_to_dict(results), 
-                                       indent=2, ensure_ascii=False, default=str)
+                    content = dumps_json(self._bulk_results_to_dict(results), indent=2,
+                                         ensure_ascii=False, default=str)
                     
                 elif format_type == 'csv':
                     filename = f"measurement_results_{timestamp}.csv"
@@ -325,7 +327,7 @@ class MeasurementOutputFormatter:
                     continue
                     
                 else:
-                    logger.warning(f"Unknown format: {format_type}")
+                    logger.warning("Unknown format: %s", format_type)
                     results_status[format_type] = False
                     continue
                 
@@ -334,11 +336,11 @@ class MeasurementOutputFormatter:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(content)
                 
-                logger.info(f"Saved {format_type} results: {file_path}")
+                logger.info("Saved %s results: %s", format_type, file_path)
                 results_status[format_type] = True
                 
             except Exception as e:
-                logger.error(f"Error saving {format_type} results: {e}")
+                logger.error("Error saving %s results: %s", format_type, e)
                 results_status[format_type] = False
         
         return results_status
@@ -485,9 +487,7 @@ class MeasurementOutputFormatter:
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for file system compatibility"""
         # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(_INVALID_FILENAME_CHARS)
         
         # Remove extra spaces and limit length
         filename = ''.join(filename.split())[:50]
@@ -528,12 +528,12 @@ class MeasurementOutputFormatter:
             report_lines.append("")
             
             # Room type statistics
-            room_types = {}
+            room_types = Counter()
             total_areas = {'walls': 0, 'ceiling': 0, 'floor': 0}
             
             for room in results.room_measurements:
                 room_type = room.room_type.value if room.room_type else 'Unknown'
-                room_types[room_type] = room_types.get(room_type, 0) + 1
+                room_types[room_type] += 1
                 
                 if room.walls and room.walls.area:
                     total_areas['walls'] += room.walls.area.to_square_feet()
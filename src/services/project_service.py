@@ -5,9 +5,9 @@ Project service for managing projects, YAML upload, and work scopes
 import yaml
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, func
 
 from ..models.database import Project, Floor, Room, WorkScope, get_db_session
 
@@ -189,7 +189,10 @@ class ProjectService:
         try:
             session = get_db_session()
             
-            project = session.query(Project).filter(Project.id == project_id).first()
+            # Load floors, rooms and work scopes up front instead of one query per relationship access
+            project = session.query(Project).options(
+                selectinload(Project.floors).selectinload(Floor.rooms).selectinload(Room.work_scope)
+            ).filter(Project.id == project_id).first()
             if not project:
                 return None
             
@@ -231,23 +234,33 @@ class ProjectService:
             session.close()
     
     def get_all_projects(self) -> List[Dict]:
-        """Get all projects with basic info"""
+        """Get all projects with basic info; created_at is left as a datetime for callers to format"""
         try:
             session = get_db_session()
             
-            projects = session.query(Project).all()
+            # Count floors and rooms for every project in a single aggregate query
+            rows = session.query(
+                Project.id,
+                Project.name,
+                Project.description,
+                Project.created_at,
+                func.count(func.distinct(Floor.id)),
+                func.count(Room.id)
+            ).outerjoin(Floor, Floor.project_id == Project.id) \
+             .outerjoin(Room, Room.floor_id == Floor.id) \
+             .group_by(Project.id) \
+             .order_by(Project.id) \
+             .all()
             
             project_list = []
-            for project in projects:
-                room_count = sum(len(floor.rooms) for floor in project.floors)
-                
+            for project_id, name, description, created_at, floor_count, room_count in rows:
                 project_list.append({
-                    'id': project.id,
-                    'name': project.name,
-                    'description': project.description,
+                    'id': project_id,
+                    'name': name,
+                    'description': description,
                     'room_count': room_count,
-                    'floor_count': len(project.floors),
-                    'created_at': project.created_at.strftime('%Y-%m-%d %H:%M')
+                    'floor_count': floor_count,
+                    'created_at': created_at
                 })
             
             return project_list
@@ -446,78 +459,104 @@ class ProjectService:
             YAML string or None if error
         """
         try:
-            project_data = self.get_project_with_rooms(project_id)
-            if not project_data:
+            chunks = list(self.iter_export_project_to_yaml(project_id))
+            if not chunks:
                 return None
             
-            # Build export data structure
-            export_data = {
+            return "".join(chunks)
+            
+        except Exception as e:
+            logger.error(f"Error exporting project to YAML: {e}")
+            return None
+    
+    def iter_export_project_to_yaml(self, project_id: int) -> Iterator[str]:
+        """
+        Export project work scopes to YAML, one chunk at a time
+        
+        The project header is yielded first, then one chunk per floor, so callers
+        can start displaying output before the whole project is serialized.
+        Concatenated, the chunks equal the output of export_project_to_yaml.
+        
+        Args:
+            project_id: Project ID
+            
+        Yields:
+            YAML text chunks (nothing if the project does not exist)
+        """
+        session = get_db_session()
+        try:
+            # Floors, rooms and work scopes come from one eager load; each floor chunk is built from it
+            project = session.query(Project).options(
+                selectinload(Project.floors).selectinload(Floor.rooms).selectinload(Room.work_scope)
+            ).filter(Project.id == project_id).first()
+            if not project:
+                return
+            
+            project_export = {
                 'project': {
-                    'name': project_data['name'],
-                    'description': project_data['description'],
-                    'default_finishes': project_data['default_finishes'],
-                    'default_trim': project_data['default_trim']
-                },
-                'floors': []
+                    'name': project.name,
+                    'description': project.description,
+                    'default_finishes': project.default_finishes or {},
+                    'default_trim': project.default_trim or {}
+                }
             }
+            yield yaml.dump(project_export, default_flow_style=False, sort_keys=False, indent=2)
             
-            session = get_db_session()
+            if not project.floors:
+                yield "floors: []\n"
+                return
             
-            for floor_data in project_data['floors']:
-                floor_export = {
-                    'floor': floor_data['name'],
-                    'rooms': []
-                }
-                
-                for room_data in floor_data['rooms']:
-                    room = session.query(Room).filter(Room.id == room_data['id']).first()
-                    if not room:
-                        continue
-                    
-                    room_export = {
-                        'room': room.name,
-                        'dimensions': room.dimensions,
-                        'ceiling_height': room.ceiling_height,
-                        'measurements': room.measurements or {}
-                    }
-                    
-                    # Add work scope if available
-                    if room.work_scope:
-                        ws = room.work_scope
-                        room_export['work_scope'] = {
-                            'use_project_defaults': ws.use_project_defaults,
-                            'overrides': {
-                                'flooring': ws.flooring_override,
-                                'wall_finish': ws.wall_finish_override,
-                                'ceiling_finish': ws.ceiling_finish_override,
-                                'trim': ws.trim_overrides or {}
-                            },
-                            'paint_scope': ws.paint_scope,
-                            'demo_scope': {
-                                'demod': ws.demod_scope or {},
-                                'removal': ws.removal_scope or {}
-                            },
-                            'tasks': {
-                                'remove_replace': ws.remove_replace_items or [],
-                                'detach_reset': ws.detach_reset_items or [],
-                                'protection': ws.protection_items or []
-                            },
-                            'notes': ws.notes
-                        }
-                    
-                    floor_export['rooms'].append(room_export)
-                
-                export_data['floors'].append(floor_export)
+            yield "floors:\n"
             
+            for floor in project.floors:
+                floor_export = self._build_floor_export(floor)
+                # A top-level block sequence has the same layout as one nested under 'floors:'
+                yield yaml.dump([floor_export], default_flow_style=False, sort_keys=False, indent=2)
+        finally:
             session.close()
+    
+    def _build_floor_export(self, floor: Floor) -> Dict:
+        """Build the export structure for one eagerly loaded floor and its rooms"""
+        floor_export = {
+            'floor': floor.name,
+            'rooms': []
+        }
+        
+        for room in floor.rooms:
+            room_export = {
+                'room': room.name,
+                'dimensions': room.dimensions,
+                'ceiling_height': room.ceiling_height,
+                'measurements': room.measurements or {}
+            }
             
-            # Convert to YAML
-            yaml_output = yaml.dump(export_data, default_flow_style=False, sort_keys=False, indent=2)
-            return yaml_output
+            # Add work scope if available
+            if room.work_scope:
+                ws = room.work_scope
+                room_export['work_scope'] = {
+                    'use_project_defaults': ws.use_project_defaults,
+                    'overrides': {
+                        'flooring': ws.flooring_override,
+                        'wall_finish': ws.wall_finish_override,
+                        'ceiling_finish': ws.ceiling_finish_override,
+                        'trim': ws.trim_overrides or {}
+                    },
+                    'paint_scope': ws.paint_scope,
+                    'demo_scope': {
+                        'demod': ws.demod_scope or {},
+                        'removal': ws.removal_scope or {}
+                    },
+                    'tasks': {
+                        'remove_replace': ws.remove_replace_items or [],
+                        'detach_reset': ws.detach_reset_items or [],
+                        'protection': ws.protection_items or []
+                    },
+                    'notes': ws.notes
+                }
             
-        except Exception as e:
-            logger.error(f"Error exporting project to YAML: {e}")
-            return None
+            floor_export['rooms'].append(room_export)
+        
+        return floor_export
     
     def merge_rooms(self, room_ids_to_merge: List[int], merged_room_name: str, target_floor_id: int, merged_measurements: Dict) -> Tuple[bool, str]:
         """
@@ -539,7 +578,8 @@ class ProjectService:
             if len(room_ids_to_merge) < 2:
                 return False, "At least 2 rooms are required for merging"
             
-            if not merged_room_name.strip():
+            merged_room_name = merged_room_name.strip()
+            if not merged_room_name:
                 return False, "Merged room name is required"
             
             # Get rooms to merge
@@ -560,7 +600,7 @@ class ProjectService:
             # Create new merged room
             merged_room = Room(
                 floor_id=target_floor_id,
-                name=merged_room_name.strip(),
+                name=merged_room_name,
                 dimensions=merged_dimensions,
                 ceiling_height=merged_ceiling_height,
                 measurements=merged_measurements
@@ -611,25 +651,29 @@ class ProjectService:
         try:
             session = get_db_session()
             
-            project = session.query(Project).filter(Project.id == project_id).first()
-            if not project:
-                return []
+            has_work_scope = session.query(WorkScope.id).filter(WorkScope.room_id == Room.id).exists()
+            
+            # Fetch all active rooms of the project with their floor in one query.
+            # Merged rooms are skipped by exact prefix (SQLite LIKE would be case-insensitive)
+            rows = session.query(Room, Floor.name, has_work_scope) \
+                .join(Floor, Room.floor_id == Floor.id) \
+                .filter(Floor.project_id == project_id) \
+                .filter(func.substr(Room.name, 1, len("[MERGED]")) != "[MERGED]") \
+                .order_by(Floor.id, Room.id) \
+                .all()
             
             active_rooms = []
-            for floor in project.floors:
-                for room in floor.rooms:
-                    # Skip rooms that have been marked as merged
-                    if not room.name.startswith("[MERGED]"):
-                        active_rooms.append({
-                            'id': room.id,
-                            'floor_id': floor.id,
-                            'floor_name': floor.name,
-                            'name': room.name,
-                            'dimensions': room.dimensions,
-                            'ceiling_height': room.ceiling_height,
-                            'measurements': room.measurements or {},
-                            'has_work_scope': room.work_scope is not None
-                        })
+            for room, floor_name, room_has_work_scope in rows:
+                active_rooms.append({
+                    'id': room.id,
+                    'floor_id': room.floor_id,
+                    'floor_name': floor_name,
+                    'name': room.name,
+                    'dimensions': room.dimensions,
+                    'ceiling_height': room.ceiling_height,
+                    'measurements': room.measurements or {},
+                    'has_work_scope': bool(room_has_work_scope)
+                })
             
             return active_rooms
             
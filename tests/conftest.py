@@ -8,6 +8,20 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+@pytest.fixture(scope="session")
+def data_dir(tmp_path_factory):
+    """Temporary data directory shared by the whole test session."""
+    return tmp_path_factory.mktemp("data")
+
+@pytest.fixture
+def project_db(monkeypatch):
+    """In-memory project database installed as the global database manager."""
+    from src.models import database
+    manager = database.DatabaseManager("sqlite://")
+    monkeypatch.setattr(database, "_db_manager", manager)
+    yield manager
+    manager.close()
+
 @pytest.fixture
 def sample_project_data():
     """Sample project data for testing."""
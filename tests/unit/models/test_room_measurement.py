@@ -0,0 +1,53 @@
+"""
+Tests for room type detection in the room measurement models
+"""
+
+import pytest
+
+from models.room_measurement import MeasurementParser, RoomType
+
+# Room type checks in their original if/elif order
+_ORDERED_CHECKS = [
+    (RoomType.BEDROOM, ['bedroom', 'bed']),
+    (RoomType.BATHROOM, ['bathroom', 'bath']),
+    (RoomType.KITCHEN, ['kitchen', 'kit']),
+    (RoomType.LIVING_ROOM, ['living', 'family']),
+    (RoomType.DINING_ROOM, ['dining', 'din']),
+    (RoomType.OFFICE, ['office', 'study']),
+    (RoomType.CLOSET, ['closet', 'clo']),
+    (RoomType.HALLWAY, ['hallway', 'hall', 'corridor']),
+    (RoomType.ENTRY_FOYER, ['entry', 'foyer', 'entrance']),
+    (RoomType.GARAGE, ['garage', 'gar']),
+    (RoomType.BASEMENT, ['basement', 'cellar']),
+    (RoomType.ATTIC, ['attic', 'loft']),
+    (RoomType.LAUNDRY, ['laundry', 'utility']),
+]
+
+
+def _ordered_room_type(room_name: str) -> RoomType:
+    """Room type from testing each keyword group in order, as before the keywords were fused"""
+    name_lower = room_name.lower()
+    for room_type, words in _ORDERED_CHECKS:
+        if any(word in name_lower for word in words):
+            return room_type
+    return RoomType.OTHER
+
+
+@pytest.mark.parametrize("room_name, room_type", [
+    # Several room types in one name: the earliest listed wins, not the leftmost
+    ("Kitchen / Bedroom 2", RoomType.BEDROOM),
+    ("Hall Bath", RoomType.BATHROOM),
+    ("Garage Loft", RoomType.GARAGE),
+    ("Utility Closet", RoomType.CLOSET),
+    # Keywords inside other words and overlapping keywords
+    ("Cloakroom", RoomType.CLOSET),
+    ("Hallway", RoomType.HALLWAY),
+    ("Sugar Pantry", RoomType.GARAGE),
+    ("Dining Kitchenette", RoomType.KITCHEN),
+    ("MASTER BATHROOM", RoomType.BATHROOM),
+    ("Porch", RoomType.OTHER),
+])
+def test_detect_room_type_matches_ordered_checks(room_name, room_type):
+    """The fused keyword scan picks the same room type as the ordered checks"""
+    assert MeasurementParser.detect_room_type(room_name) == room_type
+    assert _ordered_room_type(room_name) == room_type
@@ -0,0 +1,51 @@
+"""Tests for the shared JSON helpers used by the models."""
+
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+from models import serialization
+from models.serialization import dumps_json, loads_json
+
+SAMPLE = {"value": 1e-05, "rate": 1e16, "name": "Küche", "items": [1, 2.5, None, True]}
+
+
+def test_indented_output_matches_stdlib():
+    """Indented output keeps the stdlib number and escaping format"""
+    assert dumps_json(SAMPLE, indent=2) == json.dumps(SAMPLE, indent=2)
+    assert '"value": 1e-05' in dumps_json(SAMPLE, indent=2)
+
+
+def test_unescaped_indented_output_keeps_non_ascii():
+    """ensure_ascii=False writes non-ASCII characters as-is"""
+    assert '"name": "Küche"' in dumps_json(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_compact_output_round_trips():
+    """Compact output parses back to the same data"""
+    assert loads_json(dumps_json(SAMPLE, ensure_ascii=False)) == SAMPLE
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_available(request, monkeypatch):
+    """Run a test with and without orjson in use"""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_output_does_not_depend_on_orjson(orjson_available, indent):
+    """The same data serializes to the same bytes with or without orjson"""
+    data = dict(SAMPLE, when=datetime(2024, 1, 2, 3, 4, 5), wide=2 ** 70)
+    assert dumps_json(data, indent=indent, ensure_ascii=False, default=str) == \
+        json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+
+
+def test_loads_accepts_stdlib_nan(orjson_available):
+    """NaN written by the stdlib parses back with or without orjson"""
+    assert math.isnan(loads_json(dumps_json({"value": float("nan")}))["value"])
+    assert loads_json(dumps_json(SAMPLE)) == SAMPLE
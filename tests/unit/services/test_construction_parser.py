@@ -0,0 +1,85 @@
+"""
+Tests for room and height detection in the construction measurement parser
+"""
+
+import re
+
+import pytest
+
+from services.measurement import construction_parser
+from services.measurement.construction_parser import ConstructionMeasurementParser
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Parser shared by the module"""
+    return ConstructionMeasurementParser()
+
+
+def _first_keyword(keywords, text):
+    """Earliest listed keyword contained in text, as before the keywords were fused"""
+    for keyword in keywords:
+        if keyword in text:
+            return keyword.title()
+    return None
+
+
+@pytest.mark.parametrize("text, room_name", [
+    # Several keywords in one text: the earliest listed wins, not the leftmost
+    ("Pantry next to the kitchen", "Kitchen"),
+    ("Bedroom closet", "Bedroom"),
+    ("den / family room", "Family Room"),
+    # Overlapping keywords
+    ("Hallway bathroom", "Hallway"),
+    ("garden study", "Den"),
+    ("FOYER", "Foyer"),
+])
+def test_room_name_from_text_matches_keyword_order(parser, text, room_name):
+    """The fused keyword scan picks the same room as testing each keyword in order"""
+    assert parser._detect_room_name(text) == room_name
+    assert room_name == _first_keyword(construction_parser._TEXT_ROOM_TYPES, text.lower())
+
+
+@pytest.mark.parametrize("filename, room_name", [
+    ("living_dining.jpg", "Living"),
+    ("closet-off-bedroom.PNG", "Bedroom"),
+    ("laundry_garage.jpeg", "Garage"),
+    # Only a trailing image extension is stripped before matching
+    ("attic.tiff", "Attic"),
+    ("office.bmp", "Office"),
+    ("scan.jpg", None),
+    ("photo.attic", "Attic"),
+])
+def test_room_from_filename_matches_keyword_order(parser, filename, room_name):
+    """Filename detection strips the image extension and keeps the keyword priority"""
+    assert parser._extract_room_from_filename(filename) == room_name
+
+    stem = re.sub(r'\.(jpg|jpeg|png|bmp|tiff)$', '', filename.lower())
+    assert room_name == _first_keyword(construction_parser._FILENAME_ROOM_TYPES, stem)
+
+
+def _first_height(text):
+    """Height from trying each height pattern in order, as before the patterns were fused"""
+    for pattern in construction_parser._HEIGHT_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return f"{match.group(1)}'"
+    return None
+
+
+@pytest.mark.parametrize("text, height", [
+    # Several patterns matching: the earliest listed wins, not the leftmost
+    ("9' high walls, ceiling height 10'", "10'"),
+    ("8' ceiling, height 9'", "9'"),
+    ("12' high, 11' ceiling", "11'"),
+    # Patterns overlapping at the same text
+    ("Ceiling Height 8'", "8'"),
+    ("HEIGHT 7", "7'"),
+    # Leftmost match of the winning pattern
+    ("height 8' then height 9'", "8'"),
+    ("no heights here", None),
+])
+def test_height_matches_pattern_order(parser, text, height):
+    """The fused height scan picks the same value as trying each pattern in order"""
+    assert parser._extract_height(text) == height
+    assert _first_height(text) == height
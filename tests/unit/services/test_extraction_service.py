@@ -0,0 +1,56 @@
+"""
+Tests for room detection in the advanced measurement extractor
+"""
+
+import re
+
+import pytest
+
+from models.room_measurement import RoomType
+from services.measurement.extraction_service import AdvancedMeasurementExtractor
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """Extractor without an OpenAI client"""
+    return AdvancedMeasurementExtractor()
+
+
+def _first_pattern_match(extractor, name):
+    """Room name and type from trying each room pattern in order, as before the patterns were fused"""
+    for pattern, room_type in extractor.room_patterns.items():
+        match = re.search(pattern, name, re.IGNORECASE)
+        if match:
+            return match.group(0).title(), room_type
+    return "Unknown Room", RoomType.OTHER
+
+
+@pytest.mark.parametrize("filename, room_name, room_type", [
+    # A later, longer match does not beat an earlier listed pattern
+    ("master_bedroom_2.jpg", "Master Bedroom", RoomType.BEDROOM),
+    ("hallway_closet.jpg", "Closet", RoomType.CLOSET),
+    ("utility_laundry.png", "Laundry", RoomType.LAUNDRY),
+    ("family_room_br3.jpg", "Br3", RoomType.BEDROOM),
+    # Several patterns matching at the same position
+    ("bathroom.jpg", "Bathroom", RoomType.BATHROOM),
+    ("kitchen.jpg", "Kitchen", RoomType.KITCHEN),
+    ("hall.jpg", "Hall", RoomType.HALLWAY),
+    # Leftmost match of the winning pattern
+    ("kit-and-kitchen.jpg", "Kitchen", RoomType.KITCHEN),
+    ("Great Room.PNG", "Great Room", RoomType.LIVING_ROOM),
+    ("scan_001.jpg", "Unknown Room", RoomType.OTHER),
+])
+def test_room_from_filename_matches_pattern_order(extractor, filename, room_name, room_type):
+    """The fused scanner picks the same room as trying each pattern in order"""
+    name, detected_type, _ = extractor.extract_room_from_filename(filename)
+    assert (name, detected_type) == (room_name, room_type)
+
+    stem = re.sub(r'[_\-]', ' ', filename.rsplit('.', 1)[0].lower())
+    assert (name, detected_type) == _first_pattern_match(extractor, stem)
+
+
+def test_room_patterns_with_groups_rejected(extractor, monkeypatch):
+    """Room patterns with their own capture groups would shift the fused group numbers"""
+    monkeypatch.setattr(extractor, "room_patterns", {r'(bed)room': RoomType.BEDROOM})
+    with pytest.raises(ValueError):
+        extractor._compile_room_scanner()
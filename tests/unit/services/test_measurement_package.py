@@ -0,0 +1,66 @@
+"""Tests for lazy loading in the measurement services package."""
+
+import importlib
+import sys
+
+import pytest
+
+PACKAGE = "services.measurement"
+
+
+def _package_modules():
+    """Names of the measurement package and its submodules currently imported"""
+    return [name for name in sys.modules if name == PACKAGE or name.startswith(PACKAGE + ".")]
+
+
+@pytest.fixture
+def fresh_import(monkeypatch):
+    """Import the package from scratch, restoring the original modules afterwards"""
+    parent = importlib.import_module("services")
+    # Recorded so monkeypatch puts back the parent's attribute on teardown
+    monkeypatch.setattr(parent, "measurement", getattr(parent, "measurement", None), raising=False)
+
+    def _import():
+        for name in _package_modules():
+            monkeypatch.delitem(sys.modules, name)
+        return importlib.import_module(PACKAGE)
+
+    yield _import
+
+    # Drop the fresh copies; monkeypatch then restores the modules other tests imported
+    for name in _package_modules():
+        del sys.modules[name]
+
+
+def test_submodules_not_imported_eagerly(fresh_import):
+    """Importing the package does not import its submodules"""
+    fresh_import()
+    assert "services.measurement.construction_parser" not in sys.modules
+    assert "services.measurement.yaml_formatter" not in sys.modules
+
+
+def test_lazy_attribute_access(fresh_import):
+    """Accessing an exported name imports its submodule and caches the attribute"""
+    package = fresh_import()
+    parser_cls = package.ConstructionMeasurementParser
+
+    assert "services.measurement.construction_parser" in sys.modules
+    assert parser_cls is sys.modules["services.measurement.construction_parser"].ConstructionMeasurementParser
+    assert "ConstructionMeasurementParser" in vars(package)
+
+
+def test_star_import_exposes_all_names(fresh_import):
+    """Star import resolves every name in __all__"""
+    fresh_import()
+    namespace = {}
+    exec("from services.measurement import *", namespace)
+    for name in ("ConstructionMeasurementParser", "get_construction_parser",
+                 "ConstructionYAMLFormatter", "get_yaml_formatter"):
+        assert name in namespace
+
+
+def test_unknown_attribute_raises(fresh_import):
+    """Unknown attributes raise AttributeError"""
+    package = fresh_import()
+    with pytest.raises(AttributeError):
+        package.DoesNotExist
@@ -0,0 +1,32 @@
+"""Tests for JSON output from the measurement output formatter."""
+
+import json
+
+from models.room_measurement import RoomMeasurement
+from services.measurement.output_formatter import MeasurementOutputFormatter
+
+
+def _room() -> RoomMeasurement:
+    """Room with values that expose float and non-ASCII formatting"""
+    room = RoomMeasurement(room_name="Küche", extraction_confidence=1e-05)
+    room.processing_notes.append("Größe geschätzt")
+    return room
+
+
+def test_pretty_json_matches_stdlib_format():
+    """Pretty JSON keeps the stdlib layout, number format and unescaped text"""
+    formatter = MeasurementOutputFormatter()
+    output = formatter.format_room_json(_room())
+
+    assert output == json.dumps(formatter._room_to_dict(_room()), indent=2, ensure_ascii=False, default=str)
+    assert '"extraction_confidence": 1e-05' in output
+    assert '"room_name": "Küche"' in output
+
+
+def test_compact_json_round_trips():
+    """Compact JSON parses back to the same room data"""
+    formatter = MeasurementOutputFormatter()
+    output = formatter.format_room_json(_room(), pretty=False)
+
+    assert "\n" not in output
+    assert json.loads(output) == formatter._room_to_dict(_room())
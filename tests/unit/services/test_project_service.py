@@ -0,0 +1,136 @@
+"""
+Tests for the database-backed project service queries
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.models.database import Base, DatabaseManager, Project, Room, WorkScope
+from src.services.project_service import ProjectService
+
+FLOORS_YAML = """
+- floor: ground_floor
+  rooms:
+    - room: Kitchen
+      dimensions: "12' x 10'"
+      ceiling_height: "8'"
+      measurements:
+        volume: 960 ft³
+    - room: Pantry
+    - room: "[merged] Closet"
+- floor: second_floor
+  rooms:
+    - room: Bedroom
+      dimensions: "12' x 12'"
+    - room: Bath
+"""
+
+
+def _per_row_projects(session):
+    """Project summaries built by walking the relationships row by row"""
+    return [{
+        'id': project.id,
+        'name': project.name,
+        'description': project.description,
+        'room_count': sum(len(floor.rooms) for floor in project.floors),
+        'floor_count': len(project.floors),
+        'created_at': project.created_at
+    } for project in session.query(Project).order_by(Project.id)]
+
+
+def _per_row_active_rooms(session, project_id):
+    """Active rooms built by walking the relationships row by row"""
+    project = session.query(Project).filter(Project.id == project_id).first()
+    return [{
+        'id': room.id,
+        'floor_id': floor.id,
+        'floor_name': floor.name,
+        'name': room.name,
+        'dimensions': room.dimensions,
+        'ceiling_height': room.ceiling_height,
+        'measurements': room.measurements or {},
+        'has_work_scope': room.work_scope is not None
+    } for floor in project.floors for room in floor.rooms if not room.name.startswith("[MERGED]")]
+
+
+@pytest.fixture
+def service(project_db):
+    """Project service on the in-memory database"""
+    return ProjectService()
+
+
+@pytest.fixture
+def project_ids(service, project_db):
+    """A project with merged and scope-less rooms, one with an empty floor, and an empty one"""
+    full = service.create_project("Full Project", "Rooms on two floors")
+    success, message, _ = service.upload_yaml_measurements(full.id, FLOORS_YAML)
+    assert success, message
+
+    session = project_db.get_session()
+    try:
+        rooms = {room.name: (room.id, room.floor_id) for room in session.query(Room)}
+        session.query(WorkScope).filter(WorkScope.room_id == rooms["Pantry"][0]).delete()
+        session.commit()
+    finally:
+        session.close()
+
+    success, message = service.merge_rooms([rooms["Bedroom"][0], rooms["Bath"][0]], "Suite", rooms["Bedroom"][1], {})
+    assert success, message
+
+    empty_floor = service.create_project("Empty Floor", "")
+    success, message, _ = service.upload_yaml_measurements(empty_floor.id, "- floor: basement\n  rooms: []\n")
+    assert success, message
+
+    empty = service.create_project("Empty Project", "")
+    return [full.id, empty_floor.id, empty.id]
+
+
+def test_get_all_projects_matches_per_row_counts(service, project_db, project_ids):
+    """Aggregate project list equals counting through the relationships"""
+    session = project_db.get_session()
+    try:
+        expected = _per_row_projects(session)
+    finally:
+        session.close()
+
+    assert service.get_all_projects() == expected
+    assert [(p['floor_count'], p['room_count']) for p in expected] == [(2, 6), (1, 0), (0, 0)]
+
+
+def test_get_active_rooms_matches_per_row_filter(service, project_db, project_ids):
+    """Joined active-room query equals filtering the relationships in Python"""
+    session = project_db.get_session()
+    try:
+        for project_id in project_ids:
+            assert service.get_active_rooms(project_id) == _per_row_active_rooms(session, project_id)
+    finally:
+        session.close()
+
+    active = service.get_active_rooms(project_ids[0])
+    # The merge prefix is matched case-sensitively, as str.startswith does
+    assert [room['name'] for room in active] == ["Kitchen", "Pantry", "[merged] Closet", "Suite"]
+    assert [room['has_work_scope'] for room in active] == [True, False, True, True]
+
+
+def test_get_active_rooms_unknown_project(service, project_ids):
+    """Unknown projects have no active rooms"""
+    assert service.get_active_rooms(max(project_ids) + 1) == []
+
+
+def test_indexes_added_to_existing_database(tmp_path):
+    """Opening a database created before the indexes existed adds them, and reopening is harmless"""
+    database_url = f"sqlite:///{tmp_path / 'existing.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    index_names = [index.name for table in Base.metadata.sorted_tables for index in table.indexes]
+    with engine.begin() as connection:
+        for name in index_names:
+            connection.execute(text(f"DROP INDEX {name}"))
+    engine.dispose()
+
+    for _ in range(2):
+        DatabaseManager(database_url).close()
+
+    inspector = inspect(create_engine(database_url))
+    created = {index['name'] for table in inspector.get_table_names() for index in inspector.get_indexes(table)}
+    assert set(index_names) <= created
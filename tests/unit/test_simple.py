@@ -29,31 +29,16 @@ def test_measurement_patterns():
         "Window 4x3 ft"
     ]
     
-    print("Testing measurement patterns:")
-    print("=" * 40)
-    
-    measurements = []
-    
     for text in test_texts:
-        print(f"\nTesting: '{text}'")
-        found_any = False
+        measurements = []
         
         for pattern_name, pattern in patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                found_any = True
-                print(f"  Found {pattern_name}: {match.groups()}")
-                
-                # Parse the measurement
+            for match in re.finditer(pattern, text, re.IGNORECASE):
                 measurement = parse_measurement(match, pattern_name, text)
                 if measurement:
                     measurements.append(measurement)
-                    print(f"     → {measurement}")
         
-        if not found_any:
-            print("  No patterns matched")
-    
-    return measurements
+        assert measurements, f"No measurement parsed from {text!r}"
 
 def parse_measurement(match, pattern_name: str, original_text: str):
     """Parse a specific measurement match"""
@@ -116,20 +101,3 @@ def parse_measurement(match, pattern_name: str, original_text: str):
     except (ValueError, AttributeError) as e:
         logger.warning(f"Failed to parse measurement: {e}")
         return None
-
-if __name__ == "__main__":
-    print("Construction Estimator - Pattern Test")
-    print("=" * 50)
-    
-    # Test patterns
-    measurements = test_measurement_patterns()
-    
-    print(f"\nSummary: Found {len(measurements)} measurements")
-    print("=" * 40)
-    
-    for i, measurement in enumerate(measurements, 1):
-        print(f"{i}. {measurement['display']} ({measurement['type']})")
-    
-    print("\nPattern tests completed!")
-    print("\nPhase 1 Core Logic: WORKING")
-    print("Next: Add OCR service when dependencies are available")
\ No newline at end of file
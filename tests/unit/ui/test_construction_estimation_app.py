@@ -0,0 +1,185 @@
+"""
+Tests for the V4 construction estimation app handlers
+"""
+
+import pytest
+
+FLOORS_YAML = """
+- floor: ground_floor
+  rooms:
+    - room: Kitchen
+      dimensions: "12' x 10'"
+      ceiling_height: "8'"
+      measurements:
+        volume: 960 ft³
+    - room: Living Room
+      dimensions: "20' x 15'"
+      ceiling_height: "9'"
+- floor: second_floor
+  rooms:
+    - room: Bedroom
+      dimensions: "12' x 12'"
+      ceiling_height: "8'"
+"""
+
+
+@pytest.fixture
+def app_module():
+    """The app module, skipped when Gradio is not installed"""
+    pytest.importorskip("gradio")
+    import construction_estimation_app_v4
+    return construction_estimation_app_v4
+
+
+class StubProjectService:
+    """Project service stand-in that keeps rooms in memory and counts active-room queries"""
+
+    def __init__(self):
+        self.rooms = [
+            {'id': 1, 'floor_id': 1, 'floor_name': 'ground_floor', 'name': 'Kitchen'},
+            {'id': 2, 'floor_id': 1, 'floor_name': 'ground_floor', 'name': 'Pantry'},
+        ]
+        self.active_room_queries = 0
+
+    def get_all_projects(self):
+        return []
+
+    def get_active_rooms(self, project_id):
+        self.active_room_queries += 1
+        return list(self.rooms)
+
+    def upload_yaml_measurements(self, project_id, yaml_content):
+        self.rooms.append({'id': 3, 'floor_id': 1, 'floor_name': 'ground_floor', 'name': 'Bath'})
+        return True, "Uploaded 1 room", [{'floor': 'ground_floor', 'room': 'Bath'}]
+
+    def update_room_name(self, room_id, new_name):
+        for room in self.rooms:
+            if room['id'] == room_id:
+                room['name'] = new_name
+        return True, "Room renamed"
+
+    def get_project_with_rooms(self, project_id):
+        rooms = [dict(room, measurements={}) for room in self.rooms]
+        return {'floors': [{'id': 1, 'name': 'ground_floor', 'rooms': rooms}]}
+
+    def merge_rooms(self, room_ids_to_merge, merged_room_name, target_floor_id, merged_measurements):
+        self.rooms = [room for room in self.rooms if room['id'] not in room_ids_to_merge]
+        self.rooms.append({'id': 9, 'floor_id': target_floor_id, 'floor_name': 'ground_floor',
+                           'name': merged_room_name})
+        return True, "Rooms merged"
+
+    def save_work_scope(self, room_id, work_scope_data):
+        self.saved_work_scope = work_scope_data
+        return True, "Work scope saved"
+
+
+@pytest.fixture
+def stub_app(app_module, project_db, monkeypatch):
+    """App instance backed by the stub project service, with a project selected"""
+    monkeypatch.setattr(app_module, "get_project_service", StubProjectService)
+    app = app_module.ConstructionEstimationAppV4()
+    app.current_project_id = 1
+    return app
+
+
+@pytest.fixture
+def app(app_module, project_db):
+    """App instance backed by the in-memory project database"""
+    return app_module.ConstructionEstimationAppV4()
+
+
+@pytest.fixture
+def project_id(app):
+    """Project with two floors of uploaded rooms"""
+    project = app.project_service.create_project("Test Project", "Test project description")
+    success, message, _ = app.project_service.upload_yaml_measurements(project.id, FLOORS_YAML)
+    assert success, message
+    return project.id
+
+
+def test_streamed_export_matches_full_export(app, project_id):
+    """Streamed export ends with the same document as export_project_to_yaml"""
+    app.current_project_id = project_id
+    updates = list(app.iter_export_project_yaml())
+
+    assert updates[-1] == ("Project exported successfully",
+                           app.project_service.export_project_to_yaml(project_id))
+    # Progress updates carry status text only
+    assert all(yaml_text == "" for _, yaml_text in updates[:-1])
+
+
+def test_streamed_export_without_project(app):
+    """Export without a selected project yields a single error"""
+    assert list(app.iter_export_project_yaml()) == [("Error: No project selected", "")]
+
+
+def test_room_choices_are_cached(stub_app):
+    """Repeated room lookups query the service once"""
+    first = stub_app.get_room_choices()
+    assert stub_app.get_room_choices() == first
+    assert stub_app.get_mergeable_rooms("pan") == ["ground_floor - Pantry (ID: 2)"]
+    assert stub_app.project_service.active_room_queries == 1
+
+
+def test_room_cache_invalidated_by_upload(stub_app):
+    """Uploading YAML refreshes the room choices"""
+    stub_app.get_room_choices()
+    stub_app.upload_yaml_to_current_project("- floor: ground_floor")
+
+    assert "ground_floor - Bath (ID: 3)" in stub_app.get_room_choices()
+    assert stub_app.project_service.active_room_queries == 2
+
+
+def test_room_cache_invalidated_by_rename(stub_app):
+    """Renaming a room refreshes the room choices"""
+    stub_app.get_room_choices()
+    stub_app.current_room_id = 1
+    stub_app.update_room_name("Galley")
+
+    assert stub_app.get_room_choices()[0] == "ground_floor - Galley (ID: 1)"
+
+
+def test_room_cache_invalidated_by_merge(stub_app):
+    """Merging rooms refreshes the room choices"""
+    choices = stub_app.get_room_choices()
+    success, message = stub_app.merge_selected_rooms(choices, "Open Kitchen")
+
+    assert success, message
+    assert stub_app.get_room_choices() == ["ground_floor - Open Kitchen (ID: 9)"]
+
+
+def test_work_scope_form_split_into_scope_groups(stub_app):
+    """Flat form values land in the right work scope fields, in component order"""
+    demod = {
+        'floor': 'partial', 'floor_sf': '40',
+        'walls': 'full', 'walls_sf': '99',
+        'ceiling': 'partial', 'ceiling_sf': '12',
+        'wall_insulation': 'n/a', 'wall_insulation_sf': '',
+        'ceiling_insulation': 'partial', 'ceiling_insulation_sf': '8',
+        'baseboard': 'partial', 'baseboard_lf': '30',
+    }
+    removal = {
+        'floor': 'full', 'walls': 'partial', 'ceiling': 'n/a',
+        'wall_insulation': 'full', 'ceiling_insulation': 'partial', 'baseboard': 'n/a',
+    }
+    tasks = ([{'item': 'vanity'}], [{'item': 'toilet'}], [{'item': 'floor'}])
+    form_values = (False, " tile ", " paint ", " drop ", "walls_only",
+                   *demod.values(), *removal.values(), *tasks, " check subfloor ")
+
+    stub_app.current_room_id = 1
+    assert stub_app.save_work_scope_form(*form_values) == "✅ Work scope saved"
+
+    assert stub_app.project_service.saved_work_scope == {
+        'use_project_defaults': False,
+        'flooring_override': 'tile',
+        'wall_finish_override': 'paint',
+        'ceiling_finish_override': 'drop',
+        'paint_scope': 'walls_only',
+        # Amounts only apply to partially demolished items
+        'demod_scope': dict(demod, walls_sf=''),
+        'removal_scope': removal,
+        'remove_replace_items': tasks[0],
+        'detach_reset_items': tasks[1],
+        'protection_items': tasks[2],
+        'notes': 'check subfloor'
+    }